@@ -2,14 +2,41 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from jkclient.client import JupyterKernelClient
-from jkclient.models import V1Kernel, V1KernelSpec
-from jkclient.schema import CreateKernelRequest, Kernel
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from jkclient.schema import CreateKernelRequest, Kernel, KernelView
+
+if TYPE_CHECKING:
+    from jkclient.client import JupyterKernelClient
+    from jkclient.models import V1Kernel, V1KernelSpec
+
+# Exports backed by the kubernetes client, imported on first access
+_LAZY_EXPORTS = {
+    "V1Kernel": "jkclient.models",
+    "V1KernelSpec": "jkclient.models",
+    "JupyterKernelClient": "jkclient.client",
+}
 
 __all__ = [
     "V1Kernel",
     "V1KernelSpec",
     "CreateKernelRequest",
     "Kernel",
+    "KernelView",
     "JupyterKernelClient",
 ]
+
+
+def __getattr__(name: str):
+    if module := _LAZY_EXPORTS.get(name):
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,706 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import uuid
+from http import HTTPStatus
+
+import orjson
+from kubernetes_asyncio import client, config, watch
+from kubernetes_asyncio.client import ApiException
+
+from jkclient.client import (
+    FIELD_MANAGER,
+    KERNEL_BATCH,
+    KERNEL_ID,
+    RETRY_ATTEMPTS,
+    RETRYABLE_STATUSES,
+    BaseKernelClient,
+    retry_delay,
+)
+from jkclient.schema import CreateKernelRequest
+from jkclient.schema import Kernel as KernelSchema
+from jkclient.schema import KernelCreationForbiddenError
+
+logger = logging.getLogger(__name__)
+
+
+async def _call_with_retry(func, *args, **kwargs):
+    """Await a kubernetes api function, retrying throttled and transient errors.
+
+    Args:
+        func (Callable): The api coroutine function to call.
+
+    Returns:
+        The result of `func`.
+
+    Raises:
+        ApiException: If the error is not retryable or all attempts failed.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return await func(*args, **kwargs)
+        except ApiException as e:
+            if e.status not in RETRYABLE_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+                raise
+            delay = retry_delay(attempt)
+            logger.debug("Api call failed with %s, retrying in %ss", e.status, delay)
+            await asyncio.sleep(delay)
+
+
+class _Watch(watch.Watch):
+    """`watch.Watch` decoding the events with orjson.
+
+    Kernels have no generated model on the api client, so the decoded events
+    are kept as plain dicts instead of being re-encoded and decoded again.
+
+    The watch runs on the kernel client's api client rather than opening an
+    aiohttp session of its own, `close` leaves that shared client open.
+    """
+
+    def __init__(self, api_client: client.ApiClient) -> None:
+        # Same state as the base class, which would build a new ApiClient
+        # (aiohttp session and SSL context) per watch instead
+        self._raw_return_type = None
+        self._stop = False
+        self._api_client = api_client
+        self.resource_version = None
+        self.resp = None
+
+    async def close(self) -> None:
+        if self.resp is not None:
+            self.resp.release()
+            self.resp = None
+
+    def unmarshal_event(self, data, response_type):
+        js = orjson.loads(data)
+        if js["type"] == "ERROR":
+            obj = js["object"]
+            raise ApiException(
+                status=obj["code"], reason=f"{obj['reason']}: {obj['message']}"
+            )
+        js["raw_object"] = js["object"]
+        metadata = js["object"].get("metadata") or {}
+        if resource_version := metadata.get("resourceVersion"):
+            self.resource_version = resource_version
+        return js
+
+
+class AsyncJupyterKernelClient(BaseKernelClient):
+    """Kernel client running on `kubernetes_asyncio`.
+
+    All requests of a client share one aiohttp connection pool, so many
+    kernels can be created, fetched and deleted concurrently with
+    `asyncio.gather` without blocking a thread per call.
+
+    Requires the `asyncio` extra: `pip install jkclient[asyncio]`.
+    """
+
+    def __init__(
+        self,
+        group: str = "jupyter.org",
+        version: str = "v1",
+        kind: str = "Kernel",
+        plural: str = "kernels",
+        timeout: int = 60,
+    ) -> None:
+        """Initialize the async Kernel client.
+
+        The kubernetes config is loaded lazily on the first request.
+
+        Args:
+            group (str, optional): kubernetes kernel cr group. Defaults to "jupyter.org".
+            version (str, optional): kubernetes kernel cr version. Defaults to "v1".
+            kind (str, optional): kubernetes kernel cr kind. Defaults to "Kernel".
+            plural (str, optional): kubernetes kernel cr plural. Defaults to "kernels".
+            timeout (int, optional): default timeout for kubernetes api calls. Defaults to 60.
+        """
+        super().__init__(
+            group=group, version=version, kind=kind, plural=plural, timeout=timeout
+        )
+        self._api_client: client.ApiClient | None = None
+        self._api_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> AsyncJupyterKernelClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp connection pool."""
+        if self._api_client is not None:
+            await self._api_client.close()
+            self._api_client = None
+
+    async def _get_api_instance(self) -> client.CustomObjectsApi:
+        """Load the kubernetes config on first use and return the custom objects api.
+
+        Returns:
+            client.CustomObjectsApi: The custom objects api bound to this client's pool.
+        """
+        async with self._api_lock:
+            if self._api_client is None:
+                configuration = client.Configuration()
+                try:
+                    config.load_incluster_config(client_configuration=configuration)
+                except config.ConfigException:
+                    await config.load_kube_config(client_configuration=configuration)
+                self._api_client = client.ApiClient(configuration)
+        return client.CustomObjectsApi(self._api_client)
+
+    async def create(
+        self, request: CreateKernelRequest, timeout: int = None, **kwargs
+    ) -> KernelSchema:
+        """Create a kernel resource in Kubernetes.
+
+        Args:
+            request (CreateKernelRequest): The request object containing kernel creation parameters.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
+
+        Returns:
+            KernelSchema: The created kernel's connection information.
+
+        Raises:
+            ValueError: If required environment variables are missing.
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        timeout = timeout or self.timeout
+
+        logger.debug("Creating kernel with env: %s", request.env)
+
+        kernel = self._build_kernel(request)
+        kernel_name = kernel["metadata"]["name"]
+        kernel_namespace = kernel["metadata"]["namespace"]
+
+        # Open the watch before posting so the ADDED/MODIFIED events are
+        # delivered on an already established stream. The kernel's uid is only
+        # known once applied, a terminating kernel of the same name is skipped.
+        uid = asyncio.get_running_loop().create_future()
+        ready = asyncio.ensure_future(
+            self._wait_for_kernel_ready(
+                name=kernel_name,
+                namespace=kernel_namespace,
+                uid=uid,
+                resource_version="0",
+                timeout=timeout,
+                **kwargs,
+            )
+        )
+
+        try:
+            applied = await self._apply_kernel(kernel, timeout=timeout)
+        except Exception:
+            ready.cancel()
+            raise
+        uid.set_result(applied["metadata"]["uid"])
+
+        # Re-applying a running kernel returns it ready, no need to wait then
+        if self._is_kernel_ready(applied):
+            ready.cancel()
+            return self._to_kernel_schema(name=kernel_name, kernel=applied)
+
+        try:
+            kernel = await ready
+        except ApiException as e:
+            await self._delete_quietly(name=kernel_name, namespace=kernel_namespace)
+            error_msg = f"Error waiting for kernel: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+        return self._to_kernel_schema(name=kernel_name, kernel=kernel)
+
+    async def create_many(
+        self, requests: list[CreateKernelRequest], timeout: int = None, **kwargs
+    ) -> list[KernelSchema]:
+        """Create a batch of kernel resources, waiting on them with a single watch.
+
+        Args:
+            requests (list[CreateKernelRequest]): The request objects containing kernel creation parameters.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
+
+        Returns:
+            list[KernelSchema]: The created kernels' connection information, in request order.
+
+        Raises:
+            ValueError: If required environment variables are missing, or two
+                requests resolve to the same kernel name and namespace.
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        if not requests:
+            return []
+
+        timeout = timeout or self.timeout
+
+        batch_id = uuid.uuid4().hex
+        kernels = [self._build_kernel(request) for request in requests]
+        for kernel in kernels:
+            kernel["metadata"]["labels"][KERNEL_BATCH] = batch_id
+        keys = [
+            (kernel["metadata"]["namespace"], kernel["metadata"]["name"])
+            for kernel in kernels
+        ]
+        if len(set(keys)) < len(keys):
+            # Would apply the same kernel twice and wait for one too many
+            raise ValueError("Kernel names must be unique within a batch")
+        logger.debug("Creating %s kernels in batch %s", len(kernels), batch_id)
+
+        results = await asyncio.gather(
+            *(self._apply_kernel(kernel, timeout=timeout) for kernel in kernels),
+            return_exceptions=True,
+        )
+        if errors := [result for result in results if isinstance(result, Exception)]:
+            # Don't leave the part of the batch that was applied running
+            await self._delete_kernels_quietly(
+                [
+                    kernel
+                    for kernel, result in zip(kernels, results)
+                    if not isinstance(result, Exception)
+                ]
+            )
+            raise errors[0]
+
+        try:
+            ready = await self._wait_for_kernels_ready(
+                label_selector=f"{KERNEL_BATCH}={batch_id}",
+                keys=set(keys),
+                timeout=timeout,
+                **kwargs,
+            )
+        except ApiException as e:
+            await self._delete_kernels_quietly(kernels)
+            error_msg = f"Error waiting for kernels: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+        except Exception:
+            await self._delete_kernels_quietly(kernels)
+            raise
+
+        if len(ready) < len(keys):
+            await self._delete_kernels_quietly(kernels)
+            error_msg = f"Kernel launch timeout. Waited too long ({timeout}) to get connection info."
+            raise RuntimeError(error_msg)
+        return [self._to_kernel_schema(name=key[1], kernel=ready[key]) for key in keys]
+
+    async def _delete_kernels_quietly(self, kernels: list[dict]) -> None:
+        """Delete the kernels of a failed batch, only logging errors.
+
+        Args:
+            kernels (list[dict]): The applied kernel custom resources.
+        """
+        if not kernels:
+            return
+
+        logger.warning("Deleting %s kernels of a failed batch", len(kernels))
+        await asyncio.gather(
+            *(
+                self._delete_quietly(
+                    name=kernel["metadata"]["name"],
+                    namespace=kernel["metadata"]["namespace"],
+                )
+                for kernel in kernels
+            )
+        )
+
+    async def _apply_kernel(self, kernel: dict, timeout: int = None) -> dict:
+        """Create or update a kernel resource with server-side apply.
+
+        Args:
+            kernel (dict): The kernel custom resource to apply.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
+
+        Returns:
+            dict: The applied kernel, including its current status.
+
+        Raises:
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        api_instance = await self._get_api_instance()
+
+        try:
+            # Server-side apply is idempotent, so it is safe to retry
+            response = await _call_with_retry(
+                api_instance.patch_namespaced_custom_object,
+                group=self.group,
+                version=self.version,
+                namespace=kernel["metadata"]["namespace"],
+                plural=self.plural,
+                name=kernel["metadata"]["name"],
+                body=kernel,
+                field_manager=FIELD_MANAGER,
+                force=True,
+                _content_type="application/apply-patch+yaml",
+                _request_timeout=timeout,
+            )
+            logger.debug("Kernel %s applied", kernel["metadata"]["name"])
+        except ApiException as e:
+            if e.status == HTTPStatus.FORBIDDEN.value:
+                error_msg = "Kernel creation is forbidden (403). Check permissions or resource quota limits."
+                raise KernelCreationForbiddenError(error_msg)
+            error_msg = f"Error creating kernel: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+        return response
+
+    async def get(
+        self, name: str, namespace: str = "default", timeout: int = None, **kwargs
+    ) -> KernelSchema:
+        """Get kernel connection information by name and namespace.
+
+        Args:
+            name (str): Kernel name.
+            namespace (str, optional): Kernel namespace. Defaults to "default".
+            timeout (int, optional): Timeout in seconds for getting the kernel. Defaults to None.
+
+        Returns:
+            KernelSchema: The kernel's connection information.
+
+        Raises:
+            RuntimeError: If kernel creation timed out or if there is an error getting the kernel.
+                Throttled (429) and transient 5xx errors are retried with backoff first.
+        """
+        timeout = timeout or self.timeout
+        api_instance = await self._get_api_instance()
+
+        try:
+            kernel = await _call_with_retry(
+                api_instance.get_namespaced_custom_object,
+                group=self.group,
+                version=self.version,
+                namespace=namespace,
+                plural=self.plural,
+                name=name,
+                _request_timeout=timeout,
+                **kwargs,
+            )
+        except ApiException as e:
+            error_msg = f"Error getting kernel: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+
+        if cached := self._get_cached_kernel(kernel):
+            return KernelSchema(**cached._asdict())
+
+        # Only open a watch while the kernel is still starting
+        if not self._is_kernel_ready(kernel):
+            try:
+                kernel = await self._wait_for_kernel_ready(
+                    name=name,
+                    namespace=namespace,
+                    uid=kernel["metadata"]["uid"],
+                    timeout=timeout,
+                    **kwargs,
+                )
+            except ApiException as e:
+                error_msg = f"Error waiting for kernel: {e.status}\n{e.reason}"
+                raise RuntimeError(error_msg)
+        return self._to_kernel_schema(name=name, kernel=kernel)
+
+    async def delete(
+        self, name: str, namespace: str = "default", timeout: int = None, **kwargs
+    ) -> None:
+        """Delete a kernel resource by name and namespace.
+
+        Args:
+            name (str): Kernel name.
+            namespace (str, optional): Kernel namespace. Defaults to "default".
+            timeout (int, optional): Timeout in seconds for deteting the kernel. Defaults to None.
+
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        timeout = timeout or self.timeout
+        api_instance = await self._get_api_instance()
+        self._kernel_cache.pop((namespace, name))
+
+        try:
+            await api_instance.delete_namespaced_custom_object(
+                group=self.group,
+                version=self.version,
+                namespace=namespace,
+                plural=self.plural,
+                name=name,
+                _request_timeout=timeout,
+                **kwargs,
+            )
+            logger.debug("Kernel %s deleted successfully", name)
+        except ApiException as e:
+            if e.status == HTTPStatus.NOT_FOUND.value:
+                logger.warning("Kernel %s not found", name)
+                return
+            error_msg = f"Error deleting kernel: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+
+    async def delete_by_labels(
+        self,
+        label_selector: str,
+        namespace: str = "default",
+        timeout: int = None,
+        **kwargs,
+    ) -> None:
+        """Delete all kernel resources matching a label selector in a single request.
+
+        Args:
+            label_selector (str): Kubernetes label selector, e.g. "jupyter.org/kernel-id=foo".
+            namespace (str, optional): Kernel namespace. Defaults to "default".
+            timeout (int, optional): Timeout in seconds for deteting the kernels. Defaults to None.
+
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        timeout = timeout or self.timeout
+        api_instance = await self._get_api_instance()
+
+        try:
+            await api_instance.delete_collection_namespaced_custom_object(
+                group=self.group,
+                version=self.version,
+                namespace=namespace,
+                plural=self.plural,
+                label_selector=label_selector,
+                _request_timeout=timeout,
+                **kwargs,
+            )
+            logger.debug("Kernels matching %s deleted successfully", label_selector)
+        except ApiException as e:
+            error_msg = f"Error deleting kernels: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+
+    async def delete_by_kernel_id(
+        self,
+        kerenl_id: str,
+        timeout: int = None,
+        namespace: str | None = None,
+        **kwargs,
+    ) -> None:
+        """Delete a kernel resource by kerenl_id.
+
+        Args:
+            kerenl_id (str): Kernel id.
+            timeout (int, optional): Timeout in seconds for deteting the kernel. Defaults to None.
+            namespace (str, optional): Kernel namespace, only this namespace is searched
+                when given. Defaults to None, which searches all namespaces.
+
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        timeout = timeout or self.timeout
+
+        # Only the first match is deleted, don't transfer the others
+        items = await self._list_kernels(
+            f"{KERNEL_ID}={kerenl_id}",
+            namespace=namespace,
+            timeout=timeout,
+            # The caller may pass its own limit, kwargs are list arguments
+            **{"limit": 1, **kwargs},
+        )
+        if items:
+            kernel_name = items[0]["metadata"]["name"]
+            kernel_namespace = items[0]["metadata"]["namespace"]
+            await self.delete(
+                name=kernel_name, namespace=kernel_namespace, timeout=timeout
+            )
+
+    async def delete_by_kernel_ids(
+        self,
+        kernel_ids: list[str],
+        timeout: int = None,
+        namespace: str | None = None,
+        **kwargs,
+    ) -> None:
+        """Delete the kernel resources of many kernel ids with a single lookup.
+
+        Args:
+            kernel_ids (list[str]): Kernel ids.
+            timeout (int, optional): Timeout in seconds for deteting the kernels. Defaults to None.
+            namespace (str, optional): Kernel namespace, only this namespace is searched
+                when given. Defaults to None, which searches all namespaces.
+
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        if not kernel_ids:
+            return
+
+        timeout = timeout or self.timeout
+
+        items = await self._list_kernels(
+            f"{KERNEL_ID} in ({','.join(kernel_ids)})",
+            namespace=namespace,
+            timeout=timeout,
+            **kwargs,
+        )
+        await asyncio.gather(
+            *(
+                self.delete(
+                    name=item["metadata"]["name"],
+                    namespace=item["metadata"]["namespace"],
+                    timeout=timeout,
+                    **kwargs,
+                )
+                for item in items
+            )
+        )
+
+    async def _list_kernels(
+        self,
+        label_selector: str,
+        namespace: str | None = None,
+        timeout: int = None,
+        **kwargs,
+    ) -> list[dict]:
+        """List the kernels matching a label selector.
+
+        Args:
+            label_selector (str): Kubernetes label selector.
+            namespace (str, optional): Kernel namespace. Defaults to None, which lists
+                all namespaces.
+            timeout (int, optional): Timeout in seconds for listing the kernels. Defaults to None.
+
+        Returns:
+            list[dict]: The matching kernels.
+        """
+        api_instance = await self._get_api_instance()
+        if namespace:
+            list_kernels = functools.partial(
+                api_instance.list_namespaced_custom_object, namespace=namespace
+            )
+        else:
+            list_kernels = api_instance.list_cluster_custom_object
+
+        # Decode the raw list body with orjson instead of the generated deserializer
+        response = await list_kernels(
+            group=self.group,
+            version=self.version,
+            plural=self.plural,
+            label_selector=label_selector,
+            _preload_content=False,
+            _request_timeout=timeout,
+            **kwargs,
+        )
+        items = orjson.loads(await response.read()).get("items", [])
+        logger.debug("Listed %s kernels matching %s", len(items), label_selector)
+        return items
+
+    async def _wait_for_kernel_ready(
+        self,
+        name: str,
+        namespace: str,
+        uid: str | asyncio.Future[str] | None = None,
+        resource_version: str | None = None,
+        timeout=60,
+        **kwargs,
+    ) -> dict | bool:
+        """
+        Wait for the kernel to be ready and retrieve it.
+
+        The watch is scoped to the single kernel with a `metadata.name` field
+        selector, so the apiserver only streams events for this object.
+
+        Args:
+            name (str): Kernel name.
+            namespace (str): Kernel namespace.
+            uid (str | asyncio.Future[str], optional): Kernel uid, or a future resolving
+                to it, a kernel of the same name with another uid is never returned.
+            resource_version (str, optional): Start watching after this resource version.
+                Defaults to None, which replays the kernel's current state first.
+
+        Returns:
+            dict | bool: The kernel's details if ready, or `False` if not ready.
+        """
+        api_instance = await self._get_api_instance()
+
+        logger.debug("Waiting for kernel %s to be created", name)
+        async with _Watch(api_instance.api_client).stream(
+            api_instance.list_namespaced_custom_object,
+            group=self.group,
+            version=self.version,
+            namespace=namespace,
+            plural=self.plural,
+            field_selector=f"metadata.name={name}",
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=timeout,
+            **kwargs,
+        ) as stream:
+            async for event in stream:
+                if event["type"] in {"ADDED", "MODIFIED"}:
+                    obj = event["object"]
+                    logger.debug("Kernel %s received event: %s", name, event["type"])
+                    if not self._is_kernel_ready(obj):
+                        continue
+                    if isinstance(uid, asyncio.Future):
+                        uid = await uid
+                    if uid is not None and obj["metadata"].get("uid") != uid:
+                        continue
+                    logger.debug("Kernel %s is ready.", name)
+                    return obj
+
+        # The apiserver closes the stream once `timeout_seconds` elapsed
+        logger.warning("Timeout waiting for kernel %s to be ready, delete it", name)
+        await self._delete_quietly(name=name, namespace=namespace)
+        return False
+
+    async def _delete_quietly(self, name: str, namespace: str) -> None:
+        """Delete a kernel while cleaning up after a failure, only logging errors.
+
+        Args:
+            name (str): Kernel name.
+            namespace (str): Kernel namespace.
+        """
+        try:
+            await self.delete(name=name, namespace=namespace)
+        except RuntimeError as e:
+            logger.warning("Failed to delete kernel %s: %s", name, e)
+
+    async def _wait_for_kernels_ready(
+        self, label_selector: str, keys: set[tuple[str, str]], timeout=60, **kwargs
+    ) -> dict[tuple[str, str], dict]:
+        """
+        Wait for a batch of kernels to be ready with a single label-scoped watch.
+
+        The watch is namespaced when the whole batch is in one namespace.
+
+        Args:
+            label_selector (str): Label selector matching the whole batch.
+            keys (set[tuple[str, str]]): The (namespace, name) of the kernels to wait for.
+
+        Returns:
+            dict[tuple[str, str], dict]: The ready kernels by (namespace, name), kernels
+                that did not become ready in time are missing.
+        """
+        api_instance = await self._get_api_instance()
+
+        namespaces = {namespace for namespace, _ in keys}
+        if len(namespaces) == 1:
+            # The usual case, only needs namespace scoped list and watch rights
+            list_kernels = functools.partial(
+                api_instance.list_namespaced_custom_object,
+                namespace=namespaces.pop(),
+            )
+        else:
+            list_kernels = api_instance.list_cluster_custom_object
+
+        ready = {}
+        async with _Watch(api_instance.api_client).stream(
+            list_kernels,
+            group=self.group,
+            version=self.version,
+            plural=self.plural,
+            label_selector=label_selector,
+            resource_version="0",
+            allow_watch_bookmarks=True,
+            timeout_seconds=timeout,
+            **kwargs,
+        ) as stream:
+            async for event in stream:
+                if event["type"] in {"ADDED", "MODIFIED"}:
+                    obj = event["object"]
+                    key = (obj["metadata"]["namespace"], obj["metadata"]["name"])
+                    if key in keys and self._is_kernel_ready(obj):
+                        logger.debug("Kernel %s is ready.", key[1])
+                        ready[key] = obj
+                        if len(ready) == len(keys):
+                            return ready
+
+        logger.warning("Timeout waiting for kernels %s to be ready", label_selector)
+        return ready
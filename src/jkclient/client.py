@@ -1,44 +1,165 @@
 from __future__ import annotations
 
-import datetime
-import json
+import asyncio
+import functools
 import logging
 import os
-import re
-import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from http import HTTPStatus
 
-import kubernetes.client.models
-import six
-from dateutil.parser import parse
+import orjson
+import urllib3
 from kubernetes import client, config, watch
 from kubernetes.client import ApiException
 
-import jkclient.models
-from jkclient.models import V1Kernel
 from jkclient.schema import CreateKernelRequest
 from jkclient.schema import Kernel as KernelSchema
-from jkclient.schema import KernelCreationForbiddenError
+from jkclient.schema import KernelCreationForbiddenError, KernelView
 
 logger = logging.getLogger(__name__)
 
 KERNEL_ID = "jupyter.org/kernel-id"
 KERNEL_CONNECTION = "jupyter.org/kernel-connection-info"
+KERNEL_BATCH = "jupyter.org/kernel-batch"
+# Field manager owning the fields set by server-side apply
+FIELD_MANAGER = "jkclient"
 
+KERNEL_VOLUME_KEYS = frozenset(("KERNEL_VOLUMES", "KERNEL_VOLUME_MOUNTS"))
 
-class JupyterKernelClient:
-    PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
-    NATIVE_TYPES_MAPPING = {
-        "int": int,
-        "long": int if six.PY3 else long,  # type: ignore # noqa: F821
-        "float": float,
-        "str": str,
-        "bool": bool,
-        "date": datetime.date,
-        "datetime": datetime.datetime,
-        "object": object,
-    }
+# Static parts of every kernel pod, merged with the per request fields
+KERNEL_POD_SPEC_TEMPLATE = {"restartPolicy": "Never"}
+KERNEL_CONTAINER_TEMPLATE = {"name": "main"}
+
+# Sized for bursts from create_many() and gathered a* calls on large hosts
+API_CONNECTION_POOL_MAXSIZE = max(64, (os.cpu_count() or 1) * 4)
+KERNEL_CACHE_MAXSIZE = 1024
+
+# Throttled (APF) and transient apiserver errors worth retrying
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 0.2
+RETRY_BACKOFF_MAX = 5.0
+
+
+@functools.lru_cache(maxsize=None)
+def _get_api_client() -> client.ApiClient:
+    """Load the kubernetes config once per process and return a shared api client.
+
+    Every `JupyterKernelClient` reuses the returned client, so the kubeconfig or
+    service account token is only parsed once and the HTTPS connection pool to
+    the apiserver is shared across instances.
+
+    Returns:
+        client.ApiClient: The shared kubernetes api client.
+    """
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        config.load_kube_config()
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = API_CONNECTION_POOL_MAXSIZE
+    # Re-establish dropped keep-alive connections transparently. Reads and
+    # statuses are not retried here, throttling is handled by `_call_with_retry`.
+    configuration.retries = urllib3.Retry(total=3, read=False, backoff_factor=0.2)
+    return client.ApiClient(configuration)
+
+
+def retry_delay(attempt: int) -> float:
+    """Capped exponential backoff delay before retrying a failed api call.
+
+    Args:
+        attempt (int): Zero based number of the attempt that failed.
+
+    Returns:
+        float: Seconds to wait before the next attempt.
+    """
+    return min(RETRY_BACKOFF * 2**attempt, RETRY_BACKOFF_MAX)
+
+
+async def _close_on_shutdown(async_client):
+    """Close `async_client` once its event loop shuts down its async generators.
+
+    Advanced once on the client's loop, `asyncio.run` (and `aclose()`) then
+    finalize it on that same loop, before the loop is closed.
+    """
+    try:
+        yield
+    finally:
+        await async_client.close()
+
+
+def _call_with_retry(func, *args, **kwargs):
+    """Call a kubernetes api function, retrying throttled and transient errors.
+
+    Args:
+        func (Callable): The api function to call.
+
+    Returns:
+        The result of `func`.
+
+    Raises:
+        ApiException: If the error is not retryable or all attempts failed.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return func(*args, **kwargs)
+        except ApiException as e:
+            if e.status not in RETRYABLE_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+                raise
+            delay = retry_delay(attempt)
+            logger.debug("Api call failed with %s, retrying in %ss", e.status, delay)
+            time.sleep(delay)
+
+
+class _KernelCache:
+    """Bounded, thread-safe cache of ready kernels' connection information.
+
+    Entries are keyed by (namespace, name) and tagged with the resource
+    version they were built from, the oldest entry is evicted when full.
+    """
+
+    def __init__(self, maxsize: int = KERNEL_CACHE_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: dict[tuple[str, str], tuple[str, KernelView]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str], resource_version: str) -> KernelView | None:
+        """Return the entry of `key` if it was built from `resource_version`."""
+        cached = self._entries.get(key)
+        if cached and cached[0] == resource_version:
+            return cached[1]
+        return None
+
+    def put(
+        self, key: tuple[str, str], resource_version: str, view: KernelView
+    ) -> None:
+        """Cache `view`, evicting the oldest entry if the cache is full."""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Dicts keep insertion order
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (resource_version, view)
+
+    def pop(self, key: tuple[str, str]) -> None:
+        """Drop the entry of `key`, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class BaseKernelClient:
+    """Shared state and helpers of the sync and async kernel clients.
+
+    Builds kernel custom resources and converts ready kernels to their
+    connection information, without doing any I/O itself.
+    """
 
     def __init__(
         self,
@@ -47,7 +168,6 @@ class JupyterKernelClient:
         kind: str = "Kernel",
         plural: str = "kernels",
         timeout: int = 60,
-        **kwargs,
     ) -> None:
         """Initialize the Kernel client.
 
@@ -58,16 +178,6 @@ class JupyterKernelClient:
             plural (str, optional): kubernetes kernel cr plural. Defaults to "kernels".
             timeout (int, optional): default timeout for kubernetes api calls. Defaults to 60.
         """
-        if kwargs.pop("incluster", None):
-            logger.warning(
-                "`incluster` is deprecated, will be removed in a future version"
-            )
-
-        try:
-            config.load_incluster_config()
-        except config.ConfigException:
-            config.load_kube_config()
-
         self.kind = kind
         self.plural = plural
         self.group = group
@@ -75,49 +185,58 @@ class JupyterKernelClient:
         self.timeout = timeout
 
         self.api_version = f"{group}/{version}"
-        self.api_instance = client.CustomObjectsApi()
+        self._kernel_template = {"apiVersion": self.api_version, "kind": kind}
+        # Connection info of ready kernels, by (namespace, name)
+        self._kernel_cache = _KernelCache()
 
-    def create(
-        self, request: CreateKernelRequest, timeout: int = None, **kwargs
-    ) -> KernelSchema:
-        """Create a kernel resource in Kubernetes.
+    def _build_kernel(self, request: CreateKernelRequest) -> dict:
+        """Build the kernel custom resource for a creation request.
 
         Args:
             request (CreateKernelRequest): The request object containing kernel creation parameters.
-            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
 
         Returns:
-            KernelSchema: The created kernel's connection information.
+            dict: The kernel custom resource to create.
 
         Raises:
             ValueError: If required environment variables are missing.
-            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
-            RuntimeError: For other errors during kernel creation.
         """
-        timeout = timeout or self.timeout
-
         env = request.env
-        logger.debug("Creating kernel with env: %s", env)
 
         # Validate required environment variables
-        if not env.get("KERNEL_IMAGE"):
+        kernel_image = env.get("KERNEL_IMAGE")
+        if not kernel_image:
             raise ValueError("`KERNEL_IMAGE` must be specified")
-        if not env.get("KERNEL_ID"):
+        kernel_id = env.get("KERNEL_ID")
+        if not kernel_id:
             raise ValueError("`KERNEL_ID` must be specified")
 
-        kernel_id = env["KERNEL_ID"]
         kernel_user = env.get("KERNEL_USERNAME", "jovyan")
         kernel_name = request.name or f"{kernel_user}-{kernel_id}"
         kernel_namespace = env.get("KERNEL_NAMESPACE", "default")
 
-        # Extract volumes and volume mounts
-        kernel_volumes = env.pop("KERNEL_VOLUMES", [])
-        kernel_volume_mounts = env.pop("KERNEL_VOLUME_MOUNTS", [])
+        # Extract volumes and volume mounts, leaving the request env untouched
+        kernel_volumes = env.get("KERNEL_VOLUMES", [])
+        kernel_volume_mounts = env.get("KERNEL_VOLUME_MOUNTS", [])
+
+        container = {
+            **KERNEL_CONTAINER_TEMPLATE,
+            # Env values are passed as strings, skipping the volume definitions.
+            # An unset (None) value becomes empty rather than the string "None".
+            "env": [
+                {"name": name, "value": "" if value is None else str(value)}
+                for name, value in env.items()
+                if name not in KERNEL_VOLUME_KEYS
+            ],
+            "image": kernel_image,
+            "volumeMounts": kernel_volume_mounts,
+        }
+        if working_dir := env.get("KERNEL_WORKING_DIR"):
+            container["workingDir"] = working_dir
 
-        # Build kernel dictionary
-        kernel_dict = {
-            "apiVersion": self.api_version,
-            "kind": self.kind,
+        # Plain dicts are sent as is, no V1* model is built per request
+        return {
+            **self._kernel_template,
             "metadata": {
                 "labels": {KERNEL_ID: kernel_id},
                 "name": kernel_name,
@@ -126,54 +245,334 @@ class JupyterKernelClient:
             "spec": {
                 "template": {
                     "spec": {
-                        "containers": [
-                            {
-                                "env": [
-                                    {"name": name, "value": value}
-                                    for name, value in env.items()
-                                ],
-                                "image": env["KERNEL_IMAGE"],
-                                "name": "main",
-                                "volumeMounts": kernel_volume_mounts,
-                                "workingDir": env.get("KERNEL_WORKING_DIR"),
-                            }
-                        ],
-                        "restartPolicy": "Never",
+                        **KERNEL_POD_SPEC_TEMPLATE,
+                        "containers": [container],
                         "volumes": kernel_volumes,
                     }
                 }
             },
         }
 
-        kernel = self._deserialize(kernel_dict, V1Kernel)
+    def _to_kernel_schema(self, name: str, kernel: dict | bool) -> KernelSchema:
+        """Build the kernel connection information from a ready kernel object.
 
-        try:
-            response = self.api_instance.create_namespaced_custom_object(
-                group=self.group,
-                version=self.version,
-                namespace=kernel_namespace,
-                plural=self.plural,
-                body=kernel,
-                _request_timeout=timeout,
-                **kwargs,
-            )
-            logger.debug("Kernel creation response: %s", response)
-        except ApiException as e:
-            if e.status == HTTPStatus.CONFLICT.value:
-                logger.debug("Kernel %s already exists", kernel_name)
-                return self.get(name=kernel_name, namespace=kernel_namespace)
-            if e.status == HTTPStatus.FORBIDDEN.value:
-                error_msg = "Kernel creation is forbidden (403). Check permissions or resource quota limits."
-                raise KernelCreationForbiddenError(error_msg)
-            error_msg = f"Error creating kernel: {e.status}\n{e.reason}"
+        Args:
+            name (str): Kernel name.
+            kernel (dict | bool): The ready kernel, or `False` if it never became ready.
+
+        Returns:
+            KernelSchema: The kernel's connection information.
+
+        Raises:
+            RuntimeError: If the kernel did not become ready in time.
+        """
+        return KernelSchema(**self._to_kernel_view(name=name, kernel=kernel)._asdict())
+
+    def _to_kernel_view(self, name: str, kernel: dict | bool) -> KernelView:
+        """Build the lightweight kernel connection information from a ready kernel object.
+
+        The result is cached by the kernel's resource version for later `get` calls.
+
+        Args:
+            name (str): Kernel name.
+            kernel (dict | bool): The ready kernel, or `False` if it never became ready.
+
+        Returns:
+            KernelView: The kernel's connection information.
+
+        Raises:
+            RuntimeError: If the kernel did not become ready in time.
+        """
+        if not kernel:
+            error_msg = f"Kernel launch timeout. Waited too long ({self.timeout}) to get connection info."
             raise RuntimeError(error_msg)
 
-        return self.get(name=kernel_name, namespace=kernel_namespace, **kwargs)
+        metadata = kernel["metadata"]
+        annotations = metadata.get("annotations") or {}
+        kernel_id = annotations.get(KERNEL_ID, "")
 
-    async def acreate(
+        # Prefer the structured `status.connInfo` field, it is already decoded
+        # by the api client. Fall back to the JSON annotation for controllers
+        # that do not publish it.
+        conn_info = (kernel.get("status") or {}).get("connInfo")
+        if conn_info is None:
+            conn_info = annotations.get(KERNEL_CONNECTION, None)
+            conn_info = orjson.loads(conn_info) if conn_info else {}
+
+        view = KernelView(name=name, kernel_id=kernel_id, conn_info=conn_info)
+
+        self._kernel_cache.put(
+            (metadata["namespace"], metadata["name"]), metadata["resourceVersion"], view
+        )
+        return view
+
+    def _get_cached_kernel(self, kernel: dict) -> KernelView | None:
+        """Get the cached connection information of a kernel.
+
+        The cached entry is only returned if it was built from the same
+        resource version as the given kernel, i.e. the kernel was not modified.
+
+        Args:
+            kernel (dict): The kernel as returned by the kubernetes api.
+
+        Returns:
+            KernelView | None: The cached connection information, or `None` on a miss.
+        """
+        metadata = kernel["metadata"]
+        view = self._kernel_cache.get(
+            (metadata["namespace"], metadata["name"]), metadata["resourceVersion"]
+        )
+        if view is not None:
+            logger.debug("Kernel %s served from cache", metadata["name"])
+        return view
+
+    @staticmethod
+    def _is_kernel_ready(kernel: dict) -> bool:
+        """Check whether the kernel reports a `Ready` condition with status "True".
+
+        Args:
+            kernel (dict): The kernel as returned by the kubernetes api.
+
+        Returns:
+            bool: Whether the kernel is ready.
+        """
+        for condition in (kernel.get("status") or {}).get("conditions", []):
+            # Condition types are unique
+            if condition.get("type") == "Ready":
+                return condition.get("status") == "True"
+        return False
+
+
+class _Watch(watch.Watch):
+    """`watch.Watch` decoding the events with orjson.
+
+    Kernels have no generated model on the api client, so the decoded events
+    are kept as plain dicts instead of being re-encoded and decoded again.
+    The watch runs on the kernel client's api client instead of building one.
+    """
+
+    def __init__(self, api_client: client.ApiClient) -> None:
+        # Same state as the base class, which would build a new ApiClient
+        # (configuration copy and connection pool) per watch instead
+        self._raw_return_type = None
+        self._stop = False
+        self._api_client = api_client
+        self.resource_version = None
+
+    def unmarshal_event(self, data, return_type):
+        js = orjson.loads(data)
+        js["raw_object"] = js["object"]
+        if js["type"] != "ERROR":
+            metadata = js["object"].get("metadata") or {}
+            if resource_version := metadata.get("resourceVersion"):
+                self.resource_version = resource_version
+        return js
+
+
+class _KernelInformer:
+    """Shared watch over the kernels of one namespace.
+
+    A daemon thread lists the kernels carrying the kernel id label, i.e. the
+    ones built by this client, and follows them with a single resumable watch,
+    keeping the ready ones in memory. Any number of waiters share this one
+    stream instead of opening a watch each, an event only wakes the waiters
+    of the kernel it is about.
+    """
+
+    def __init__(self, api_instance, group, version, plural, namespace) -> None:
+        self._list = functools.partial(
+            api_instance.list_namespaced_custom_object,
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            label_selector=KERNEL_ID,
+        )
+        self.namespace = namespace
+        self._api_client = api_instance.api_client
+        # name -> kernel, for the kernels reporting Ready
+        self._kernels: dict[str, dict] = {}
+        # name -> number of threads waiting on that kernel
+        self._waiters: dict[str, int] = {}
+        # name -> uid of the kernel deleted while someone was waiting on the name
+        self._deleted: dict[str, str] = {}
+        # Guards the state above
+        self._lock = threading.Lock()
+        # name -> condition notified on changes of that kernel, while waited on
+        self._changed: dict[str, threading.Condition] = {}
+        self._watch = _Watch(self._api_client)
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"kernel-informer-{namespace}", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start following the namespace in the background."""
+        self._thread.start()
+
+    def wait(self, name: str, uid: str, timeout: float) -> dict | bool:
+        """Wait for the kernel to be ready.
+
+        Args:
+            name (str): Kernel name.
+            uid (str): Kernel uid, a deleted kernel of the same name is never returned.
+            timeout (float): Timeout in seconds.
+
+        Returns:
+            dict | bool: The kernel's details if ready, or `False` if not ready or deleted.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._waiters[name] = self._waiters.get(name, 0) + 1
+            changed = self._changed.get(name)
+            if changed is None:
+                changed = self._changed[name] = threading.Condition(self._lock)
+            try:
+                while not self._stopped:
+                    kernel = self._kernels.get(name)
+                    if kernel and kernel["metadata"].get("uid") == uid:
+                        return kernel
+                    if self._deleted.get(name) == uid:
+                        logger.warning("Kernel %s was deleted while waiting", name)
+                        return False
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    changed.wait(remaining)
+                return False
+            finally:
+                self._waiters[name] -= 1
+                if not self._waiters[name]:
+                    del self._waiters[name]
+                    del self._changed[name]
+                    self._deleted.pop(name, None)
+
+    def stop(self) -> None:
+        """Stop following the namespace."""
+        self._stopped = True
+        self._watch.stop()
+        with self._lock:
+            self._notify_all()
+
+    def _notify_all(self) -> None:
+        """Wake all waiters, the lock must be held."""
+        for changed in self._changed.values():
+            changed.notify_all()
+
+    def _run(self) -> None:
+        resource_version = None
+        attempt = 0
+        while not self._stopped:
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                for event in self._watch.stream(
+                    self._list,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                ):
+                    attempt = 0
+                    self._handle(event)
+                # Only reached once stopped
+                return
+            except ApiException as e:
+                if e.status == HTTPStatus.GONE.value:
+                    # Our resource version expired, list the current state again
+                    logger.debug("Kernel watch on %s expired", self.namespace)
+                    resource_version = None
+                    self._watch = _Watch(self._api_client)
+                    continue
+                logger.warning("Kernel watch on %s failed: %s", self.namespace, e)
+            except Exception as e:
+                logger.warning("Kernel watch on %s failed: %s", self.namespace, e)
+            resource_version = self._watch.resource_version or resource_version
+            self._watch = _Watch(self._api_client)
+            time.sleep(retry_delay(attempt))
+            attempt += 1
+
+    def _relist(self) -> str:
+        """List the kernels of the namespace and replace the known state with them.
+
+        Returns:
+            str: The resource version to start watching from.
+        """
+        response = self._list(_preload_content=False)
+        kernels = orjson.loads(response.data)
+        ready = {
+            kernel["metadata"]["name"]: kernel
+            for kernel in kernels.get("items", [])
+            if BaseKernelClient._is_kernel_ready(kernel)
+        }
+        with self._lock:
+            # Rebuilt rather than merged, kernels deleted since the last watch are dropped
+            self._kernels = ready
+            self._notify_all()
+        return kernels["metadata"]["resourceVersion"]
+
+    def _handle(self, event: dict) -> None:
+        if event["type"] not in {"ADDED", "MODIFIED", "DELETED"}:
+            return
+        obj = event["object"]
+        metadata = obj["metadata"]
+        name = metadata["name"]
+        logger.debug("Kernel %s received event: %s", name, event["type"])
+        with self._lock:
+            if event["type"] == "DELETED":
+                self._kernels.pop(name, None)
+                if name in self._waiters:
+                    self._deleted[name] = metadata.get("uid")
+            elif BaseKernelClient._is_kernel_ready(obj):
+                self._kernels[name] = obj
+            else:
+                self._kernels.pop(name, None)
+            if changed := self._changed.get(name):
+                changed.notify_all()
+
+
+class JupyterKernelClient(BaseKernelClient):
+    def __init__(
+        self,
+        group: str = "jupyter.org",
+        version: str = "v1",
+        kind: str = "Kernel",
+        plural: str = "kernels",
+        timeout: int = 60,
+        **kwargs,
+    ) -> None:
+        """Initialize the Kernel client.
+
+        Args:
+            group (str, optional): kubernetes kernel cr group. Defaults to "jupyter.org".
+            version (str, optional): kubernetes kernel cr version. Defaults to "v1".
+            kind (str, optional): kubernetes kernel cr kind. Defaults to "Kernel".
+            plural (str, optional): kubernetes kernel cr plural. Defaults to "kernels".
+            timeout (int, optional): default timeout for kubernetes api calls. Defaults to 60.
+        """
+        if kwargs.pop("incluster", None):
+            logger.warning(
+                "`incluster` is deprecated, will be removed in a future version"
+            )
+
+        super().__init__(
+            group=group, version=version, kind=kind, plural=plural, timeout=timeout
+        )
+        self.api_instance = client.CustomObjectsApi(_get_api_client())
+        # (namespace, name) -> future of the get currently fetching that kernel
+        self._inflight: dict[tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # namespace -> shared watch serving `_wait_for_kernel_ready`
+        self._informers: dict[str, _KernelInformer] = {}
+        self._informers_lock = threading.Lock()
+        # asyncio client backing the `a*` methods, bound to the loop it was made on
+        self._async_client = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        # Closes the asyncio client when its loop shuts down, see `_close_on_shutdown`
+        self._async_closer = None
+
+    def create(
         self, request: CreateKernelRequest, timeout: int = None, **kwargs
     ) -> KernelSchema:
-        """Asynchronously create a kernel resource in Kubernetes.
+        """Create a kernel resource in Kubernetes.
 
         Args:
             request (CreateKernelRequest): The request object containing kernel creation parameters.
@@ -189,77 +588,207 @@ class JupyterKernelClient:
         """
         timeout = timeout or self.timeout
 
-        env = request.env
-        logger.debug("Asynchronously creating kernel with env: %s", env)
+        logger.debug("Creating kernel with env: %s", request.env)
 
-        if not env.get("KERNEL_IMAGE"):
-            raise ValueError("`KERNEL_IMAGE` must be specified")
-        if not env.get("KERNEL_ID"):
-            raise ValueError("`KERNEL_ID` must be specified")
+        kernel = self._build_kernel(request)
+        kernel_name = kernel["metadata"]["name"]
 
-        kernel_id = env["KERNEL_ID"]
-        kernel_user = env.get("KERNEL_USERNAME", "jovyan")
-        kernel_name = request.name or f"{kernel_user}-{kernel_id}"
-        kernel_namespace = env.get("KERNEL_NAMESPACE", "default")
+        kernel = self._apply_kernel(kernel, timeout=timeout)
+        # Re-applying a running kernel returns it ready, no need to wait then.
+        # Otherwise the shared watch lists the namespace before following it,
+        # so the kernel is reported even if it became ready first.
+        if not self._is_kernel_ready(kernel):
+            kernel = self._wait_for_kernel_ready(kernel, timeout=timeout)
+        return self._to_kernel_schema(name=kernel_name, kernel=kernel)
 
-        kernel_volumes = env.pop("KERNEL_VOLUMES", [])
-        kernel_volume_mounts = env.pop("KERNEL_VOLUME_MOUNTS", [])
+    def create_many(
+        self, requests: list[CreateKernelRequest], timeout: int = None, **kwargs
+    ) -> list[KernelSchema]:
+        """Create a batch of kernel resources, waiting on them with a single watch.
 
-        kernel_dict = {
-            "apiVersion": self.api_version,
-            "kind": self.kind,
-            "metadata": {
-                "labels": {KERNEL_ID: kernel_id},
-                "name": kernel_name,
-                "namespace": kernel_namespace,
-            },
-            "spec": {
-                "template": {
-                    "spec": {
-                        "containers": [
-                            {
-                                "env": [
-                                    {"name": name, "value": value}
-                                    for name, value in env.items()
-                                ],
-                                "image": env["KERNEL_IMAGE"],
-                                "name": "main",
-                                "volumeMounts": kernel_volume_mounts,
-                                "workingDir": env.get("KERNEL_WORKING_DIR"),
-                            }
-                        ],
-                        "restartPolicy": "Never",
-                        "volumes": kernel_volumes,
-                    }
-                }
-            },
-        }
+        The kernels are applied concurrently and stamped with a batch label, a
+        single label-scoped watch then reports readiness for the whole batch.
+
+        Args:
+            requests (list[CreateKernelRequest]): The request objects containing kernel creation parameters.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
 
-        kernel = self._deserialize(kernel_dict, V1Kernel)
+        Returns:
+            list[KernelSchema]: The created kernels' connection information, in request order.
+
+        Raises:
+            ValueError: If required environment variables are missing, or two
+                requests resolve to the same kernel name and namespace.
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        if not requests:
+            return []
+
+        timeout = timeout or self.timeout
+
+        batch_id = uuid.uuid4().hex
+        kernels = [self._build_kernel(request) for request in requests]
+        for kernel in kernels:
+            kernel["metadata"]["labels"][KERNEL_BATCH] = batch_id
+        keys = [
+            (kernel["metadata"]["namespace"], kernel["metadata"]["name"])
+            for kernel in kernels
+        ]
+        if len(set(keys)) < len(keys):
+            # Would apply the same kernel twice and wait for one too many
+            raise ValueError("Kernel names must be unique within a batch")
+        logger.debug("Creating %s kernels in batch %s", len(kernels), batch_id)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(kernels), API_CONNECTION_POOL_MAXSIZE)
+        ) as executor:
+            futures = [
+                executor.submit(self._apply_kernel, kernel, timeout=timeout)
+                for kernel in kernels
+            ]
+        if errors := [future.exception() for future in futures if future.exception()]:
+            # Don't leave the part of the batch that was applied running
+            self._delete_kernels_quietly(
+                [
+                    kernel
+                    for kernel, future in zip(kernels, futures)
+                    if not future.exception()
+                ]
+            )
+            raise errors[0]
 
         try:
-            response = self.api_instance.create_namespaced_custom_object(
-                group=self.group,
-                version=self.version,
-                namespace=kernel_namespace,
-                plural=self.plural,
+            ready = self._wait_for_kernels_ready(
+                label_selector=f"{KERNEL_BATCH}={batch_id}",
+                keys=set(keys),
+                timeout=timeout,
+                **kwargs,
+            )
+        except ApiException as e:
+            self._delete_kernels_quietly(kernels)
+            error_msg = f"Error waiting for kernels: {e.status}\n{e.reason}"
+            raise RuntimeError(error_msg)
+        except Exception:
+            self._delete_kernels_quietly(kernels)
+            raise
+
+        if len(ready) < len(keys):
+            self._delete_kernels_quietly(kernels)
+            error_msg = f"Kernel launch timeout. Waited too long ({timeout}) to get connection info."
+            raise RuntimeError(error_msg)
+        return [self._to_kernel_schema(name=key[1], kernel=ready[key]) for key in keys]
+
+    def _delete_kernels_quietly(self, kernels: list[dict]) -> None:
+        """Delete the kernels of a failed batch, only logging errors.
+
+        Args:
+            kernels (list[dict]): The applied kernel custom resources.
+        """
+        if not kernels:
+            return
+
+        logger.warning("Deleting %s kernels of a failed batch", len(kernels))
+        with ThreadPoolExecutor(
+            max_workers=min(len(kernels), API_CONNECTION_POOL_MAXSIZE)
+        ) as executor:
+            for kernel in kernels:
+                executor.submit(
+                    self._delete_quietly,
+                    name=kernel["metadata"]["name"],
+                    namespace=kernel["metadata"]["namespace"],
+                )
+
+    def _apply_kernel(self, kernel: dict, timeout: int = None) -> dict:
+        """Create or update a kernel resource with server-side apply.
+
+        Applying is idempotent, so throttled and transient errors are safely
+        retried and an already existing kernel is not an error.
+
+        Args:
+            kernel (dict): The kernel custom resource to apply.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
+
+        Returns:
+            dict: The applied kernel, including its current status.
+
+        Raises:
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        metadata = kernel["metadata"]
+        api_client = self.api_instance.api_client
+        # The generated patch method cannot send the apply content type
+        try:
+            response = _call_with_retry(
+                api_client.call_api,
+                "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}",
+                "PATCH",
+                path_params={
+                    "group": self.group,
+                    "version": self.version,
+                    "namespace": metadata["namespace"],
+                    "plural": self.plural,
+                    "name": metadata["name"],
+                },
+                query_params=[("fieldManager", FIELD_MANAGER), ("force", True)],
+                header_params={
+                    "Accept": "application/json",
+                    "Content-Type": "application/apply-patch+yaml",
+                },
                 body=kernel,
-                async_req=True,
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                # Decode the raw body with orjson instead of the generated deserializer
+                _preload_content=False,
                 _request_timeout=timeout,
-                **kwargs,
             )
-            logger.debug("Asynchronous kernel creation response: %s", response.get())
+            logger.debug("Kernel %s applied: %s", metadata["name"], response.status)
         except ApiException as e:
-            if e.status == HTTPStatus.CONFLICT.value:
-                logger.debug("Kernel %s already exists", kernel_name)
-                return await self.aget(name=kernel_name, namespace=kernel_namespace)
             if e.status == HTTPStatus.FORBIDDEN.value:
                 error_msg = "Kernel creation is forbidden (403). Check permissions or resource quota limits."
                 raise KernelCreationForbiddenError(error_msg)
             error_msg = f"Error creating kernel: {e.status}\n{e.reason}"
             raise RuntimeError(error_msg)
+        return orjson.loads(response.data)
 
-        return await self.aget(name=kernel_name, namespace=kernel_namespace, **kwargs)
+    async def acreate(
+        self, request: CreateKernelRequest, timeout: int = None, **kwargs
+    ) -> KernelSchema:
+        """Asynchronously create a kernel resource in Kubernetes.
+
+        Args:
+            request (CreateKernelRequest): The request object containing kernel creation parameters.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
+
+        Returns:
+            KernelSchema: The created kernel's connection information.
+
+        Raises:
+            ValueError: If required environment variables are missing.
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        return await self._run_async("create", request, timeout=timeout, **kwargs)
+
+    async def acreate_many(
+        self, requests: list[CreateKernelRequest], timeout: int = None, **kwargs
+    ) -> list[KernelSchema]:
+        """Asynchronously create a batch of kernel resources, waiting on them with a single watch.
+
+        Args:
+            requests (list[CreateKernelRequest]): The request objects containing kernel creation parameters.
+            timeout (int, optional): Timeout in seconds for kernel creation. Defaults to None.
+
+        Returns:
+            list[KernelSchema]: The created kernels' connection information, in request order.
+
+        Raises:
+            ValueError: If required environment variables are missing.
+            KernelCreationForbiddenError: If kernel creation is forbidden by Kubernetes.
+            RuntimeError: For other errors during kernel creation.
+        """
+        return await self._run_async("create_many", requests, timeout=timeout, **kwargs)
 
     def get(
         self, name: str, namespace: str = "default", timeout: int = None, **kwargs
@@ -276,11 +805,84 @@ class JupyterKernelClient:
 
         Raises:
             RuntimeError: If kernel creation timed out or if there is an error getting the kernel.
+                Throttled (429) and transient 5xx errors are retried with backoff first.
+        """
+        view = self.get_fast(name=name, namespace=namespace, timeout=timeout, **kwargs)
+        return KernelSchema(**view._asdict())
+
+    def get_fast(
+        self, name: str, namespace: str = "default", timeout: int = None, **kwargs
+    ) -> KernelView:
+        """Get kernel connection information by name and namespace, without validation.
+
+        Same as `get`, but returns a lightweight `KernelView` tuple instead of a
+        pydantic model, for high-QPS read paths.
+
+        Args:
+            name (str): Kernel name.
+            namespace (str, optional): Kernel namespace. Defaults to "default".
+            timeout (int, optional): Timeout in seconds for getting the kernel. Defaults to None.
+
+        Returns:
+            KernelView: The kernel's connection information.
+
+        Raises:
+            RuntimeError: If kernel creation timed out or if there is an error getting the kernel.
+                Throttled (429) and transient 5xx errors are retried with backoff first.
+        """
+        if kwargs:
+            # Extra api arguments may change the result, don't share it
+            return self._fetch_kernel_view(
+                name=name, namespace=namespace, timeout=timeout, **kwargs
+            )
+
+        # Coalesce concurrent gets of the same kernel into one apiserver roundtrip
+        key = (namespace, name)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            timeout = timeout or self.timeout
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                error_msg = f"Kernel launch timeout. Waited too long ({timeout}) to get connection info."
+                raise RuntimeError(error_msg)
+
+        try:
+            view = self._fetch_kernel_view(
+                name=name, namespace=namespace, timeout=timeout
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(view)
+            return view
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_kernel_view(
+        self, name: str, namespace: str, timeout: int = None, **kwargs
+    ) -> KernelView:
+        """Fetch the kernel and wait for it to be ready, see `get_fast`.
+
+        Args:
+            name (str): Kernel name.
+            namespace (str): Kernel namespace.
+            timeout (int, optional): Timeout in seconds for getting the kernel. Defaults to None.
+
+        Returns:
+            KernelView: The kernel's connection information.
         """
         timeout = timeout or self.timeout
 
         try:
-            kernel = self.api_instance.get_namespaced_custom_object(
+            kernel = _call_with_retry(
+                self.api_instance.get_namespaced_custom_object,
                 group=self.group,
                 version=self.version,
                 namespace=namespace,
@@ -293,20 +895,13 @@ class JupyterKernelClient:
             error_msg = f"Error getting kernel: {e.status}\n{e.reason}"
             raise RuntimeError(error_msg)
 
-        if kernel := self._wait_for_kernel_ready(
-            name=name, namespace=namespace, **kwargs
-        ):
-            kernel_id = kernel["metadata"]["annotations"].get(KERNEL_ID, "")
-            conn_info = kernel["metadata"]["annotations"].get(KERNEL_CONNECTION, None)
-
-            return KernelSchema(
-                name=name,
-                kernel_id=kernel_id,
-                conn_info=json.loads(conn_info) if conn_info else {},
-            )
+        if cached := self._get_cached_kernel(kernel):
+            return cached
 
-        error_msg = f"Kernel launch timeout. Waited too long ({self.timeout}) to get connection info."
-        raise RuntimeError(error_msg)
+        # Only open a watch while the kernel is still starting
+        if not self._is_kernel_ready(kernel):
+            kernel = self._wait_for_kernel_ready(kernel, timeout=timeout)
+        return self._to_kernel_view(name=name, kernel=kernel)
 
     async def aget(
         self, name: str, namespace: str = "default", timeout: int = None, **kwargs
@@ -323,39 +918,11 @@ class JupyterKernelClient:
 
         Raises:
             RuntimeError: If kernel creation timed out or if there is an error getting the kernel.
+                Throttled (429) and transient 5xx errors are retried with backoff first.
         """
-        timeout = timeout or self.timeout
-
-        try:
-            response = self.api_instance.get_namespaced_custom_object(
-                group=self.group,
-                version=self.version,
-                namespace=namespace,
-                plural=self.plural,
-                name=name,
-                async_req=True,
-                _request_timeout=timeout,
-                **kwargs,
-            )
-            kernel = response.get()
-        except ApiException as e:
-            error_msg = f"Error getting kernel: {e.status}\n{e.reason}"
-            raise RuntimeError(error_msg)
-
-        if kernel := self._wait_for_kernel_ready(
-            name=name, namespace=namespace, **kwargs
-        ):
-            kernel_id = kernel["metadata"]["annotations"].get(KERNEL_ID, "")
-            conn_info = kernel["metadata"]["annotations"].get(KERNEL_CONNECTION, None)
-
-            return KernelSchema(
-                name=name,
-                kernel_id=kernel_id,
-                conn_info=json.loads(conn_info) if conn_info else {},
-            )
-
-        error_msg = f"Kernel launch timeout. Waited too long ({self.timeout}) to get connection info."
-        raise RuntimeError(error_msg)
+        return await self._run_async(
+            "get", name, namespace=namespace, timeout=timeout, **kwargs
+        )
 
     def delete(
         self, name: str, namespace: str = "default", timeout: int = None, **kwargs
@@ -371,6 +938,7 @@ class JupyterKernelClient:
             RuntimeError: For errors during kernel deletion.
         """
         timeout = timeout or self.timeout
+        self._kernel_cache.pop((namespace, name))
 
         try:
             self.api_instance.delete_namespaced_custom_object(
@@ -400,290 +968,487 @@ class JupyterKernelClient:
             namespace (str, optional): Kernel namespace. Defaults to "default".
             timeout (int, optional): Timeout in seconds for deteting the kernel. Defaults to None.
 
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        return await self._run_async(
+            "delete", name, namespace=namespace, timeout=timeout, **kwargs
+        )
+
+    def delete_by_labels(
+        self,
+        label_selector: str,
+        namespace: str = "default",
+        timeout: int = None,
+        **kwargs,
+    ) -> None:
+        """Delete all kernel resources matching a label selector in a single request.
+
+        Args:
+            label_selector (str): Kubernetes label selector, e.g. "jupyter.org/kernel-id=foo".
+            namespace (str, optional): Kernel namespace. Defaults to "default".
+            timeout (int, optional): Timeout in seconds for deteting the kernels. Defaults to None.
+
         Raises:
             RuntimeError: For errors during kernel deletion.
         """
         timeout = timeout or self.timeout
 
         try:
-            self.api_instance.delete_namespaced_custom_object(
+            self.api_instance.delete_collection_namespaced_custom_object(
                 group=self.group,
                 version=self.version,
                 namespace=namespace,
                 plural=self.plural,
-                name=name,
-                async_req=True,
+                label_selector=label_selector,
                 _request_timeout=timeout,
                 **kwargs,
             )
-            logger.debug("Asynchronously deleted kernel %s", name)
+            logger.debug("Kernels matching %s deleted successfully", label_selector)
         except ApiException as e:
-            if e.status == HTTPStatus.NOT_FOUND.value:
-                logger.warning("Kernel %s not found", name)
-                return
-            error_msg = f"Error deleting kernel: {e.status}\n{e.reason}"
+            error_msg = f"Error deleting kernels: {e.status}\n{e.reason}"
             raise RuntimeError(error_msg)
 
+    async def adelete_by_labels(
+        self,
+        label_selector: str,
+        namespace: str = "default",
+        timeout: int = None,
+        **kwargs,
+    ) -> None:
+        """Asynchronously delete all kernel resources matching a label selector in a single request.
+
+        Args:
+            label_selector (str): Kubernetes label selector, e.g. "jupyter.org/kernel-id=foo".
+            namespace (str, optional): Kernel namespace. Defaults to "default".
+            timeout (int, optional): Timeout in seconds for deteting the kernels. Defaults to None.
+
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        return await self._run_async(
+            "delete_by_labels",
+            label_selector,
+            namespace=namespace,
+            timeout=timeout,
+            **kwargs,
+        )
+
     def delete_by_kernel_id(
-        self, kerenl_id: str, timeout: int = None, **kwargs
+        self,
+        kerenl_id: str,
+        timeout: int = None,
+        namespace: str | None = None,
+        **kwargs,
     ) -> None:
         """Delete a kernel resource by kerenl_id.
 
         Args:
             kerenl_id (str): Kernel id.
             timeout (int, optional): Timeout in seconds for deteting the kernel. Defaults to None.
+            namespace (str, optional): Kernel namespace, only this namespace is searched
+                when given. Defaults to None, which searches all namespaces.
 
         Raises:
             RuntimeError: For errors during kernel deletion.
         """
         timeout = timeout or self.timeout
 
-        label_selector = f"{KERNEL_ID}={kerenl_id}"
-        kernels = self.api_instance.list_cluster_custom_object(
-            group=self.group,
-            version=self.version,
-            plural=self.plural,
-            label_selector=label_selector,
-            **kwargs,
+        # Only the first match is deleted, don't transfer the others
+        items = self._list_kernels(
+            f"{KERNEL_ID}={kerenl_id}",
+            namespace=namespace,
+            timeout=timeout,
+            # The caller may pass its own limit, kwargs are list arguments
+            **{"limit": 1, **kwargs},
         )
-        logger.debug("List kernel response %s", kernels)
-        if items := kernels.get("items", []):
+        if items:
             kernel_name = items[0]["metadata"]["name"]
             kernel_namespace = items[0]["metadata"]["namespace"]
-            self.delete(name=kernel_name, namespace=kernel_namespace, **kwargs)
+            self.delete(name=kernel_name, namespace=kernel_namespace, timeout=timeout)
 
-    async def adelete_by_kernel_id(
-        self, kerenl_id: str, timeout: int = None, **kwargs
+    def delete_by_kernel_ids(
+        self,
+        kernel_ids: list[str],
+        timeout: int = None,
+        namespace: str | None = None,
+        **kwargs,
     ) -> None:
-        """
-        Asynchronously delete a kernel resource by name and namespace.
+        """Delete the kernel resources of many kernel ids with a single lookup.
 
         Args:
-            kerenl_id (str): Kernel id.
-            timeout (int, optional): Timeout in seconds for deteting the kernel. Defaults to None.
+            kernel_ids (list[str]): Kernel ids.
+            timeout (int, optional): Timeout in seconds for deteting the kernels. Defaults to None.
+            namespace (str, optional): Kernel namespace, only this namespace is searched
+                when given. Defaults to None, which searches all namespaces.
 
         Raises:
             RuntimeError: For errors during kernel deletion.
         """
+        if not kernel_ids:
+            return
+
         timeout = timeout or self.timeout
 
-        label_selector = f"{KERNEL_ID}={kerenl_id}"
-        response = self.api_instance.list_cluster_custom_object(
+        items = self._list_kernels(
+            f"{KERNEL_ID} in ({','.join(kernel_ids)})",
+            namespace=namespace,
+            timeout=timeout,
+            **kwargs,
+        )
+        if not items:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(items), API_CONNECTION_POOL_MAXSIZE)
+        ) as executor:
+            # Consume the results so a failed delete is raised here
+            list(
+                executor.map(
+                    lambda item: self.delete(
+                        name=item["metadata"]["name"],
+                        namespace=item["metadata"]["namespace"],
+                        timeout=timeout,
+                        **kwargs,
+                    ),
+                    items,
+                )
+            )
+
+    def _list_kernels(
+        self,
+        label_selector: str,
+        namespace: str | None = None,
+        timeout: int = None,
+        **kwargs,
+    ) -> list[dict]:
+        """List the kernels matching a label selector.
+
+        Args:
+            label_selector (str): Kubernetes label selector.
+            namespace (str, optional): Kernel namespace. Defaults to None, which lists
+                all namespaces.
+            timeout (int, optional): Timeout in seconds for listing the kernels. Defaults to None.
+
+        Returns:
+            list[dict]: The matching kernels.
+        """
+        if namespace:
+            list_kernels = functools.partial(
+                self.api_instance.list_namespaced_custom_object, namespace=namespace
+            )
+        else:
+            list_kernels = self.api_instance.list_cluster_custom_object
+
+        # Decode the raw list body with orjson instead of the generated deserializer
+        response = list_kernels(
             group=self.group,
             version=self.version,
             plural=self.plural,
             label_selector=label_selector,
-            async_req=True,
+            _preload_content=False,
             _request_timeout=timeout,
             **kwargs,
         )
-        kernels = response.get()
-        logger.debug("List kernel response %s", kernels)
-        if items := kernels.get("items", []):
-            kernel_name = items[0]["metadata"]["name"]
-            kernel_namespace = items[0]["metadata"]["namespace"]
-            await self.adelete(name=kernel_name, namespace=kernel_namespace, **kwargs)
+        items = orjson.loads(response.data).get("items", [])
+        logger.debug("Listed %s kernels matching %s", len(items), label_selector)
+        return items
 
-    def _wait_for_kernel_ready(
-        self, name: str, namespace: str, timeout=60, **kwargs
-    ) -> dict | bool:
+    async def adelete_by_kernel_id(
+        self,
+        kerenl_id: str,
+        timeout: int = None,
+        namespace: str | None = None,
+        **kwargs,
+    ) -> None:
         """
-        Wait for the kernel to be ready and retrieve it.
+        Asynchronously delete a kernel resource by name and namespace.
 
         Args:
-            name (str): Kernel name.
-            namespace (str): Kernel namespace.
+            kerenl_id (str): Kernel id.
+            timeout (int, optional): Timeout in seconds for deteting the kernel. Defaults to None.
+            namespace (str, optional): Kernel namespace, only this namespace is searched
+                when given. Defaults to None, which searches all namespaces.
 
-        Returns:
-            dict | bool: The kernel's details if ready, or `False` if not ready.
+        Raises:
+            RuntimeError: For errors during kernel deletion.
         """
-        w = watch.Watch()
-        start_time = time.time()
-        logger.debug("Waiting for kernel %s to be created", name)
-        try:
-            for event in w.stream(
-                self.api_instance.list_namespaced_custom_object,
-                group=self.group,
-                version=self.version,
-                namespace=namespace,
-                plural=self.plural,
-                timeout_seconds=timeout,
-                **kwargs,
-            ):
-                if event["type"] in {"ADDED", "MODIFIED"}:
-                    obj = event["object"]
-                    if obj["metadata"]["name"] == name and obj.get("status"):
-                        logger.debug(
-                            "Kernel %s received event: %s", name, event["type"]
-                        )
-                        conditions = obj["status"].get("conditions", [])
-                        available_condition = next(
-                            (c for c in conditions if c.get("type") == "Ready"), None
-                        )
-                        if (
-                            available_condition
-                            and available_condition.get("status") == "True"
-                        ):
-                            logger.debug("Kernel %s is ready.", name)
-                            return obj
-                if time.time() - start_time > timeout:
-                    logger.warning(
-                        "Timeout waiting for kernel %s to be ready, delete it", name
-                    )
-                    self.delete(name=name, namespace=namespace, **kwargs)
-                    return False
-        finally:
-            w.stop()
+        return await self._run_async(
+            "delete_by_kernel_id",
+            kerenl_id,
+            timeout=timeout,
+            namespace=namespace,
+            **kwargs,
+        )
 
-        return False
+    async def adelete_by_kernel_ids(
+        self,
+        kernel_ids: list[str],
+        timeout: int = None,
+        namespace: str | None = None,
+        **kwargs,
+    ) -> None:
+        """Asynchronously delete the kernel resources of many kernel ids with a single lookup.
 
-    def _deserialize(self, data, klass):
-        """Deserializes dict, list, str into an object.
+        Args:
+            kernel_ids (list[str]): Kernel ids.
+            timeout (int, optional): Timeout in seconds for deteting the kernels. Defaults to None.
+            namespace (str, optional): Kernel namespace, only this namespace is searched
+                when given. Defaults to None, which searches all namespaces.
 
-        :param data: dict, list or str.
-        :param klass: class literal, or string of class name.
+        Raises:
+            RuntimeError: For errors during kernel deletion.
+        """
+        return await self._run_async(
+            "delete_by_kernel_ids",
+            kernel_ids,
+            timeout=timeout,
+            namespace=namespace,
+            **kwargs,
+        )
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the asyncio client backing the `a*` methods."""
+        if self._async_client is not None:
+            await self._async_closer.aclose()
+            self._async_client = None
+            self._async_loop = None
+            self._async_closer = None
 
-        :return: object.
+    async def _get_async_client(self):
+        """Return the asyncio client for the running event loop.
+
+        aiohttp sessions are bound to the loop they were created on, so a new
+        client is made when the loop changes. Each client is closed on its own
+        loop, either when that loop shuts down or, if it still runs in another
+        thread, when it is replaced.
+
+        Returns:
+            AsyncJupyterKernelClient | None: The asyncio client, or `None` if the
+                `asyncio` extra is not installed.
         """
-        if data is None:
+        try:
+            from jkclient.async_client import AsyncJupyterKernelClient
+        except ImportError:
             return None
 
-        if klass == "file":
-            return self.__deserialize_file(data)
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_loop is loop:
+            return self._async_client
 
-        if type(klass) == str:  # noqa: E721
-            if klass.startswith("list["):
-                sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
-                return [self._deserialize(sub_data, sub_kls) for sub_data in data]
+        old_closer, old_loop = self._async_closer, self._async_loop
+        self._async_client = AsyncJupyterKernelClient(
+            group=self.group,
+            version=self.version,
+            kind=self.kind,
+            plural=self.plural,
+            timeout=self.timeout,
+        )
+        self._async_client._kernel_cache = self._kernel_cache
+        self._async_loop = loop
+        self._async_closer = _close_on_shutdown(self._async_client)
+        await self._async_closer.asend(None)
+        if old_closer is not None and old_loop.is_running():
+            # Still serving another thread, close the session over there. A
+            # stopped loop already closed it when shutting down, the session
+            # can't be closed from this loop.
+            asyncio.run_coroutine_threadsafe(old_closer.aclose(), old_loop)
+        return self._async_client
+
+    async def _run_async(self, method: str, *args, **kwargs):
+        """Await `method` on the asyncio client.
+
+        Without the `asyncio` extra the sync method is run in the default
+        executor instead, so the event loop is never blocked.
 
-            if klass.startswith("dict("):
-                sub_kls = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
-                return {
-                    k: self._deserialize(v, sub_kls) for k, v in six.iteritems(data)
-                }
+        Args:
+            method (str): Name of the client method to call.
 
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                try:
-                    klass = getattr(jkclient.models, klass)
-                except AttributeError:
-                    klass = getattr(kubernetes.client.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:  # noqa: E721
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        Returns:
+            The result of `method`.
+        """
+        if async_client := await self._get_async_client():
+            return await getattr(async_client, method)(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(getattr(self, method), *args, **kwargs)
+        )
 
-    def __deserialize_file(self, response):
-        """Deserializes body to file
+    def reload_config(self) -> None:
+        """Load the kubernetes config again and rebind this client to it.
 
-        Saves response body into a file in a temporary folder,
-        using the filename from the `Content-Disposition` header if provided.
+        The config is otherwise loaded once per process, e.g. call this after
+        the kubeconfig or service account token changed.
+        """
+        old_api_client = self.api_instance.api_client
+        _get_api_client.cache_clear()
+        self.close()
+        self.api_instance = client.CustomObjectsApi(_get_api_client())
+
+        # Release the old client's thread pool and pooled connections, both are
+        # recreated lazily should another holder still use it.
+        old_api_client.close()
+        old_api_client.rest_client.pool_manager.clear()
+
+    def close(self) -> None:
+        """Stop the shared watches started by `create` and `get`."""
+        with self._informers_lock:
+            informers, self._informers = self._informers, {}
+        for informer in informers.values():
+            informer.stop()
+
+    def _get_informer(self, namespace: str) -> _KernelInformer:
+        """Return the shared watch over `namespace`, starting it on first use.
 
-        :param response:  RESTResponse.
-        :return: file path.
+        Args:
+            namespace (str): Kernel namespace.
+
+        Returns:
+            _KernelInformer: The namespace's shared watch.
         """
-        fd, path = tempfile.mkstemp(dir=self.configuration.temp_folder_path)
-        os.close(fd)
-        os.remove(path)
+        with self._informers_lock:
+            informer = self._informers.get(namespace)
+            if informer is None:
+                informer = self._informers[namespace] = _KernelInformer(
+                    self.api_instance,
+                    group=self.group,
+                    version=self.version,
+                    plural=self.plural,
+                    namespace=namespace,
+                )
+                informer.start()
+        return informer
+
+    def _wait_for_kernel_ready(self, kernel: dict, timeout=60) -> dict | bool:
+        """
+        Wait for the kernel to be ready and retrieve it.
 
-        content_disposition = response.getheader("Content-Disposition")
-        if content_disposition:
-            filename = re.search(
-                r'filename=[\'"]?([^\'"\s]+)[\'"]?', content_disposition
-            ).group(1)
-            path = os.path.join(os.path.dirname(path), filename)
+        Kernels built by this client share one watch per namespace, see
+        `_KernelInformer`. Others are watched on their own with a
+        `metadata.name` field selector.
 
-        with open(path, "wb") as f:
-            f.write(response.data)
+        Args:
+            kernel (dict): The kernel as returned by the kubernetes api.
 
-        return path
+        Returns:
+            dict | bool: The kernel's details if ready, or `False` if not ready.
+        """
+        metadata = kernel["metadata"]
+        name = metadata["name"]
+        namespace = metadata["namespace"]
 
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
+        logger.debug("Waiting for kernel %s to be created", name)
+        if KERNEL_ID in (metadata.get("labels") or {}):
+            informer = self._get_informer(namespace)
+            ready = informer.wait(name, uid=metadata["uid"], timeout=timeout)
+        else:
+            ready = self._watch_kernel_ready(
+                name, namespace=namespace, uid=metadata["uid"], timeout=timeout
+            )
+        if not ready:
+            logger.warning("Timeout waiting for kernel %s to be ready, delete it", name)
+            self._delete_quietly(name=name, namespace=namespace)
+        return ready
 
-        :param data: str.
-        :param klass: class literal.
+    def _delete_quietly(self, name: str, namespace: str) -> None:
+        """Delete a kernel while cleaning up after a failure, only logging errors.
 
-        :return: int, long, float, str, bool.
+        Args:
+            name (str): Kernel name.
+            namespace (str): Kernel namespace.
         """
         try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return an original value.
+            self.delete(name=name, namespace=namespace)
+        except RuntimeError as e:
+            logger.warning("Failed to delete kernel %s: %s", name, e)
 
-        :return: object.
+    def _watch_kernel_ready(
+        self, name: str, namespace: str, uid: str, timeout=60
+    ) -> dict | bool:
         """
-        return value
+        Wait for a single kernel to be ready with a watch scoped to its name.
 
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
+        Args:
+            name (str): Kernel name.
+            namespace (str): Kernel namespace.
+            uid (str): Kernel uid, a deleted kernel of the same name is never returned.
 
-        :param string: str.
-        :return: date.
+        Returns:
+            dict | bool: The kernel's details if ready, or `False` if not ready.
         """
+        w = _Watch(self.api_instance.api_client)
         try:
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise ValueError("Failed to parse `{0}` as date object".format(string))
+            for event in w.stream(
+                self.api_instance.list_namespaced_custom_object,
+                group=self.group,
+                version=self.version,
+                namespace=namespace,
+                plural=self.plural,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=timeout,
+            ):
+                if event["type"] in {"ADDED", "MODIFIED"}:
+                    obj = event["object"]
+                    if obj["metadata"].get("uid") == uid and self._is_kernel_ready(obj):
+                        logger.debug("Kernel %s is ready.", name)
+                        return obj
+        finally:
+            w.stop()
+        return False
 
-    def __deserialize_datetime(self, string):
-        """Deserializes string to datetime.
+    def _wait_for_kernels_ready(
+        self, label_selector: str, keys: set[tuple[str, str]], timeout=60, **kwargs
+    ) -> dict[tuple[str, str], dict]:
+        """
+        Wait for a batch of kernels to be ready with a single label-scoped watch.
+
+        The watch is namespaced when the whole batch is in one namespace.
 
-        The string should be in iso8601 datetime format.
+        Args:
+            label_selector (str): Label selector matching the whole batch.
+            keys (set[tuple[str, str]]): The (namespace, name) of the kernels to wait for.
 
-        :param string: str.
-        :return: datetime.
+        Returns:
+            dict[tuple[str, str], dict]: The ready kernels by (namespace, name), kernels
+                that did not become ready in time are missing.
         """
+        ready = {}
+        if not keys:
+            return ready
+
+        namespaces = {namespace for namespace, _ in keys}
+        if len(namespaces) == 1:
+            # The usual case, only needs namespace scoped list and watch rights
+            list_kernels = functools.partial(
+                self.api_instance.list_namespaced_custom_object,
+                namespace=namespaces.pop(),
+            )
+        else:
+            list_kernels = self.api_instance.list_cluster_custom_object
+
+        w = _Watch(self.api_instance.api_client)
         try:
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            error_msg = "Failed to parse `{0}` as datetime object".format(string)
-            raise ValueError(error_msg)
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if not klass.openapi_types and not hasattr(klass, "get_real_child_model"):
-            return data
-
-        kwargs = {}
-        if (
-            data is not None
-            and klass.openapi_types is not None
-            and isinstance(data, (list, dict))
-        ):
-            for attr, attr_type in six.iteritems(klass.openapi_types):
-                if klass.attribute_map[attr] in data:
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self._deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if hasattr(instance, "get_real_child_model"):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self._deserialize(data, klass_name)
-        return instance
+            for event in w.stream(
+                list_kernels,
+                group=self.group,
+                version=self.version,
+                plural=self.plural,
+                label_selector=label_selector,
+                resource_version="0",
+                allow_watch_bookmarks=True,
+                timeout_seconds=timeout,
+                **kwargs,
+            ):
+                if event["type"] in {"ADDED", "MODIFIED"}:
+                    obj = event["object"]
+                    key = (obj["metadata"]["namespace"], obj["metadata"]["name"])
+                    if key in keys and self._is_kernel_ready(obj):
+                        logger.debug("Kernel %s is ready.", key[1])
+                        ready[key] = obj
+                        if len(ready) == len(keys):
+                            return ready
+        finally:
+            w.stop()
+
+        logger.warning("Timeout waiting for kernels %s to be ready", label_selector)
+        return ready
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from kubernetes.client.configuration import Configuration
+
+
+@lru_cache(maxsize=1)
+def default_configuration() -> Configuration:
+    """Return the configuration shared by models built without one.
+
+    `Configuration()` fills in dozens of fields while the models only read
+    `client_side_validation` from it, so one instance is built lazily and reused.
+    """
+    return Configuration()
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import pprint
 
-import six
-from kubernetes.client.configuration import Configuration
+from jkclient.models._configuration import default_configuration
 
 
 class V1KernelCondition:
@@ -50,7 +49,7 @@ class V1KernelCondition:
     ):
         """V1KernelCondition - a model defined in OpenAPI"""
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = default_configuration()
         self.local_vars_configuration = local_vars_configuration
 
         self._last_transition_time = None
@@ -221,25 +220,20 @@ class V1KernelCondition:
         """Returns the model properties as a dict"""
         result = {}
 
-        for attr, _ in six.iteritems(self.openapi_types):
+        for attr in self.openapi_types:
             value = getattr(self, attr)
             if isinstance(value, list):
-                result[attr] = list(  # noqa: C417
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
+                result[attr] = [
+                    to_dict() if (to_dict := getattr(x, "to_dict", None)) else x
+                    for x in value
+                ]
             elif hasattr(value, "to_dict"):
                 result[attr] = value.to_dict()
             elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (
-                            (item[0], item[1].to_dict())
-                            if hasattr(item[1], "to_dict")
-                            else item
-                        ),
-                        value.items(),
-                    )
-                )
+                result[attr] = {
+                    k: to_dict() if (to_dict := getattr(v, "to_dict", None)) else v
+                    for k, v in value.items()
+                }
             else:
                 result[attr] = value
 
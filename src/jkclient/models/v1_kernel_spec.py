@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import pprint
+import orjson
 
-import six
-from kubernetes.client.configuration import Configuration
+from jkclient.models._configuration import default_configuration
 
 
 class V1KernelSpec:
@@ -28,6 +27,8 @@ class V1KernelSpec:
         "template": "template",
     }
 
+    __slots__ = ("_template", "discriminator", "local_vars_configuration")
+
     def __init__(
         self,
         template=None,
@@ -35,7 +36,7 @@ class V1KernelSpec:
     ):
         """V1KernelSpec - a model defined in OpenAPI"""
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = default_configuration()
         self.local_vars_configuration = local_vars_configuration
 
         self._template = None
@@ -69,35 +70,19 @@ class V1KernelSpec:
 
     def to_dict(self):
         """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.openapi_types):
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(  # noqa: C417
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (
-                            (item[0], item[1].to_dict())
-                            if hasattr(item[1], "to_dict")
-                            else item
-                        ),
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-
-        return result
+        # `template` is the only attribute, so the generic openapi_types loop is unrolled
+        template = self._template
+        if to_dict := getattr(template, "to_dict", None):
+            template = to_dict()
+        return {"template": template}
 
     def to_str(self):
         """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
+        return orjson.dumps(
+            self.to_dict(),
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+        ).decode()
 
     def __repr__(self):
         """For `print` and `pprint`"""
@@ -108,11 +93,12 @@ class V1KernelSpec:
         if not isinstance(other, V1KernelSpec):
             return False
 
+        # Compare the only attribute directly instead of building both dicts,
+        # a dict and a model template are only comparable as dicts
+        if type(self._template) is type(other._template):
+            return self._template == other._template
         return self.to_dict() == other.to_dict()
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
-        if not isinstance(other, V1KernelSpec):
-            return True
-
-        return self.to_dict() != other.to_dict()
+        return not self == other
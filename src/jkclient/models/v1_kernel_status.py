@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import pprint
 
-import six
-from kubernetes.client.configuration import Configuration
+from jkclient.models._configuration import default_configuration
 
 
 class V1KernelStatus:
@@ -22,12 +21,14 @@ class V1KernelStatus:
     """
     openapi_types = {  # noqa: RUF012
         "conditions": "list[V1KernelCondition]",
+        "conn_info": "dict(str, object)",
         "container_state": "V1ContainerState",
         "ready_replicas": "int",
     }
 
     attribute_map = {  # noqa: RUF012
         "conditions": "conditions",
+        "conn_info": "connInfo",
         "container_state": "containerState",
         "ready_replicas": "readyReplicas",
     }
@@ -35,22 +36,26 @@ class V1KernelStatus:
     def __init__(
         self,
         conditions=None,
+        conn_info=None,
         container_state=None,
         ready_replicas=None,
         local_vars_configuration=None,
     ):
         """V1KernelStatus - a model defined in OpenAPI"""
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = default_configuration()
         self.local_vars_configuration = local_vars_configuration
 
         self._conditions = None
+        self._conn_info = None
         self._ready_replicas = None
         self._container_state = None
         self.discriminator = None
 
         if conditions is not None:
             self.conditions = conditions
+        if conn_info is not None:
+            self.conn_info = conn_info
         if ready_replicas is not None:
             self.ready_replicas = ready_replicas
         if container_state is not None:
@@ -79,6 +84,29 @@ class V1KernelStatus:
 
         self._conditions = conditions
 
+    @property
+    def conn_info(self):
+        """Gets the conn_info of this V1KernelStatus.  # noqa: E501
+
+        connInfo is the connection info of the kernel, include shell_port, ip and other.  # noqa: E501
+
+        :return: The conn_info of this V1KernelStatus.  # noqa: E501
+        :rtype: dict(str, object)
+        """
+        return self._conn_info
+
+    @conn_info.setter
+    def conn_info(self, conn_info):
+        """Sets the conn_info of this V1KernelStatus.
+
+        connInfo is the connection info of the kernel, include shell_port, ip and other.  # noqa: E501
+
+        :param conn_info: The conn_info of this V1KernelStatus.  # noqa: E501
+        :type: dict(str, object)
+        """
+
+        self._conn_info = conn_info
+
     @property
     def ready_replicas(self):
         """Gets the ready_replicas of this V1KernelStatus.  # noqa: E501
@@ -129,25 +157,20 @@ class V1KernelStatus:
         """Returns the model properties as a dict"""
         result = {}
 
-        for attr, _ in six.iteritems(self.openapi_types):
+        for attr in self.openapi_types:
             value = getattr(self, attr)
             if isinstance(value, list):
-                result[attr] = list(  # noqa: C417
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
+                result[attr] = [
+                    to_dict() if (to_dict := getattr(x, "to_dict", None)) else x
+                    for x in value
+                ]
             elif hasattr(value, "to_dict"):
                 result[attr] = value.to_dict()
             elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (
-                            (item[0], item[1].to_dict())
-                            if hasattr(item[1], "to_dict")
-                            else item
-                        ),
-                        value.items(),
-                    )
-                )
+                result[attr] = {
+                    k: to_dict() if (to_dict := getattr(v, "to_dict", None)) else v
+                    for k, v in value.items()
+                }
             else:
                 result[attr] = value
 
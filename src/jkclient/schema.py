@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, field_validator
+import orjson
+from pydantic import BaseModel, Field, field_validator
+
+# Env values that may be passed as a json list str
+_LIST_ENV_KEYS = ("KERNEL_VOLUME_MOUNTS", "KERNEL_VOLUMES")
 
 
 class KernelCreationForbiddenError(RuntimeError):
@@ -25,40 +28,44 @@ class KernelCreationForbiddenError(RuntimeError):
 class CreateKernelRequest(BaseModel):
     name: str | None = None
     """Kernel spec name (defaults to default kernel spec for server)."""
-    env: dict[str, Any] = {}
+    env: dict[str, Any] = Field(default_factory=dict)
     """A dictionary of environment variables and values to include in the kernel process - subject to filtering."""
 
     @field_validator("env")
     @classmethod
     def convert_env_value_to_list(cls, v: dict[str, Any]) -> dict[str, str]:
-        if "KERNEL_VOLUME_MOUNTS" in v:
-            kernel_volume_mounts = v["KERNEL_VOLUME_MOUNTS"]
-            if isinstance(kernel_volume_mounts, str):
+        if not v:
+            return v
+
+        for key in _LIST_ENV_KEYS:
+            if key not in v:
+                continue
+            value = v[key]
+            # Already normalized, nothing to decode or check
+            if type(value) is list:
+                continue
+            if isinstance(value, str):
                 try:
-                    kernel_volume_mounts = json.loads(kernel_volume_mounts)
+                    value = orjson.loads(value)
                 except ValueError:
-                    err_msg = "`KERNEL_VOLUME_MOUNTS` must be a json str"
+                    err_msg = f"`{key}` must be a json str"
                     raise ValueError(err_msg)
-            if not isinstance(kernel_volume_mounts, list):
-                err_msg = "`KERNEL_VOLUME_MOUNTS` must be a list or json list str"
+            if not isinstance(value, list):
+                err_msg = f"`{key}` must be a list or json list str"
                 raise ValueError(err_msg)
-            v["KERNEL_VOLUME_MOUNTS"] = kernel_volume_mounts
-
-        if "KERNEL_VOLUMES" in v:
-            kernel_volumes = v["KERNEL_VOLUMES"]
-            if isinstance(v["KERNEL_VOLUMES"], str):
-                try:
-                    kernel_volumes = json.loads(kernel_volumes)
-                except ValueError:
-                    err_msg = "`KERNEL_VOLUMES` must be a json str"
-                    raise ValueError(err_msg)
-            if not isinstance(kernel_volumes, list):
-                err_msg = "`KERNEL_VOLUME` must be a list or json list str"
-                raise ValueError(err_msg)
-            v["KERNEL_VOLUMES"] = kernel_volumes
+            v[key] = value
 
         return v
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> CreateKernelRequest:
+        """Rebuild a request from the output of `model_dump` without validation.
+
+        `convert_env_value_to_list` is skipped, so only pass data that came from an
+        already validated request, never raw user input.
+        """
+        return cls.model_construct(**data)
+
     def model_dump(self):
         return super().model_dump(by_alias=True, exclude_none=True)
 
@@ -73,5 +80,16 @@ class Kernel(BaseModel):
     """Kernel spec name (defaults to default kernel spec for server)."""
     kernel_id: str
     """Indicates the id associated with the launched kernel."""
-    conn_info: dict[str, Any] = {}
+    conn_info: dict[str, Any] = Field(default_factory=dict)
+    """Kernel connection info, include kernel shell_port, service and other"""
+
+
+class KernelView(NamedTuple):
+    """Lightweight, unvalidated kernel info returned by `get_fast`."""
+
+    name: str
+    """Kernel spec name (defaults to default kernel spec for server)."""
+    kernel_id: str
+    """Indicates the id associated with the launched kernel."""
+    conn_info: dict[str, Any]
     """Kernel connection info, include kernel shell_port, service and other"""
@@ -0,0 +1,8 @@
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def kernel_name() -> str:
+    return f"kernel-{uuid4().hex}"
@@ -0,0 +1,212 @@
+from unittest import mock
+from uuid import uuid4
+
+import orjson
+import pytest
+
+pytest.importorskip("kubernetes_asyncio")
+
+from kubernetes_asyncio import watch  # noqa: E402
+from kubernetes_asyncio.client import ApiException  # noqa: E402
+
+from jkclient import CreateKernelRequest  # noqa: E402
+from jkclient.async_client import (  # noqa: E402
+    AsyncJupyterKernelClient,
+    _call_with_retry,
+    _Watch,
+)
+
+
+@pytest.fixture
+def kernel_client() -> AsyncJupyterKernelClient:
+    return AsyncJupyterKernelClient()
+
+
+@pytest.mark.asyncio
+async def test_watch_init() -> None:
+    api_client = mock.AsyncMock()
+    w = _Watch(api_client)
+
+    # Runs on the given api client with the base class' state
+    assert w._api_client is api_client
+    base = watch.Watch()
+    assert vars(w).keys() == vars(base).keys()
+    await base.close()
+
+    # The shared api client stays open
+    await w.close()
+    api_client.close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_watch_unmarshal_event() -> None:
+    w = _Watch(mock.AsyncMock())
+    obj = {"metadata": {"name": "foo-0", "resourceVersion": "42"}}
+
+    event = w.unmarshal_event(orjson.dumps({"type": "ADDED", "object": obj}), None)
+    assert event == {"type": "ADDED", "object": obj, "raw_object": obj}
+    assert w.resource_version == "42"
+
+    error = {"code": 410, "reason": "Gone", "message": "too old resource version"}
+    with pytest.raises(ApiException) as excinfo:
+        w.unmarshal_event(orjson.dumps({"type": "ERROR", "object": error}), None)
+    assert excinfo.value.status == 410
+    await w.close()
+
+
+class FakeStream:
+    """Async context manager standing in for `_Watch.stream`."""
+
+    def __init__(self, events: list) -> None:
+        self.events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def __aiter__(self):
+        for event in self.events:
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+def kernel_event(uid: str) -> dict:
+    kernel = {
+        "metadata": {
+            "name": "foo-0",
+            "namespace": "default",
+            "uid": uid,
+            "resourceVersion": uid,
+        },
+        "status": {
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "connInfo": {"uid": uid},
+        },
+    }
+    return {"type": "ADDED", "object": kernel}
+
+
+def create_kernel_request() -> CreateKernelRequest:
+    return CreateKernelRequest(
+        name="foo-0",
+        env={
+            "KERNEL_ID": "968183bb-13ef-4faf-b7d8-30fe8d20e6a3",
+            "KERNEL_IMAGE": "zjuici/tablegpt-kernel:0.1.1",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_kernel_skips_other_uid(
+    kernel_client: AsyncJupyterKernelClient,
+) -> None:
+    kernel_client._get_api_instance = mock.AsyncMock()
+    kernel_client._apply_kernel = mock.AsyncMock(
+        return_value={"metadata": {"name": "foo-0", "uid": "2"}}
+    )
+    # A terminating kernel of the same name is reported first
+    events = [kernel_event("1"), kernel_event("2")]
+
+    with mock.patch.object(_Watch, "stream", return_value=FakeStream(events)):
+        kernel = await kernel_client.create(create_kernel_request())
+    assert kernel.conn_info == {"uid": "2"}
+
+
+@pytest.mark.asyncio
+async def test_create_kernel_watch_error(
+    kernel_client: AsyncJupyterKernelClient,
+) -> None:
+    kernel_client._get_api_instance = mock.AsyncMock()
+    kernel_client._apply_kernel = mock.AsyncMock(
+        return_value={"metadata": {"name": "foo-0", "uid": "2"}}
+    )
+    kernel_client.delete = mock.AsyncMock()
+    events = [ApiException(status=403, reason="Forbidden")]
+
+    with mock.patch.object(_Watch, "stream", return_value=FakeStream(events)):
+        with pytest.raises(RuntimeError, match="403"):
+            await kernel_client.create(create_kernel_request())
+    kernel_client.delete.assert_awaited_once_with(name="foo-0", namespace="default")
+
+
+@pytest.mark.asyncio
+@mock.patch("asyncio.sleep")
+async def test_call_with_retry(sleep: mock.AsyncMock) -> None:
+    func = mock.AsyncMock(side_effect=[ApiException(status=429), "ok"])
+
+    assert await _call_with_retry(func, "foo-0", namespace="default") == "ok"
+    func.assert_awaited_with("foo-0", namespace="default")
+    assert sleep.await_count == 1
+
+    func = mock.AsyncMock(side_effect=ApiException(status=404))
+    with pytest.raises(ApiException):
+        await _call_with_retry(func)
+    assert func.await_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.skip(reason="Create kernel with kubernetes config")
+async def test_create_kernel(kernel_client: AsyncJupyterKernelClient) -> None:
+    request = CreateKernelRequest(
+        name="foo-0",
+        env={
+            "KERNEL_ID": "968183bb-13ef-4faf-b7d8-30fe8d20e6a3",
+            "KERNEL_NAMESPACE": "default",
+            "KERNEL_IMAGE": "zjuici/tablegpt-kernel:0.1.1",
+        },
+    )
+    async with kernel_client:
+        response = await kernel_client.create(request)
+    assert response is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.skip(reason="Create kernel with kubernetes config")
+async def test_create_many_kernels(kernel_client: AsyncJupyterKernelClient) -> None:
+    requests = [
+        CreateKernelRequest(
+            name=f"foo-{i}",
+            env={
+                "KERNEL_ID": str(uuid4()),
+                "KERNEL_NAMESPACE": "default",
+                "KERNEL_IMAGE": "zjuici/tablegpt-kernel:0.1.1",
+            },
+        )
+        for i in range(1, 4)
+    ]
+    async with kernel_client:
+        response = await kernel_client.create_many(requests)
+    assert [kernel.name for kernel in response] == ["foo-1", "foo-2", "foo-3"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skip(reason="Get kernel with kubernetes config")
+async def test_get_kernel(kernel_client: AsyncJupyterKernelClient) -> None:
+    async with kernel_client:
+        response = await kernel_client.get(name="foo-0", namespace="default")
+    assert response is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.skip(reason="Delete kernel with kubernetes config")
+async def test_delete_kernel(kernel_client: AsyncJupyterKernelClient) -> None:
+    async with kernel_client:
+        await kernel_client.delete(name="foo-0", namespace="default")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skip(reason="Delete kernel with kubernetes config")
+async def test_delete_kernel_by_kernel_id(
+    kernel_client: AsyncJupyterKernelClient,
+) -> None:
+    async with kernel_client:
+        await kernel_client.delete_by_kernel_id(
+            kerenl_id="968183bb-13ef-4faf-b7d8-30fe8d20e6a3"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main()
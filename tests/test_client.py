@@ -1,9 +1,24 @@
+import asyncio
+import threading
+from unittest import mock
 from uuid import uuid4
 
+import orjson
 import pytest
+from kubernetes import watch
+from kubernetes.client import ApiException
 
 from jkclient import CreateKernelRequest, JupyterKernelClient
-from jkclient.schema import KernelCreationForbiddenError
+from jkclient.client import (
+    KERNEL_ID,
+    RETRY_ATTEMPTS,
+    BaseKernelClient,
+    _call_with_retry,
+    _KernelCache,
+    _KernelInformer,
+    _Watch,
+)
+from jkclient.schema import KernelCreationForbiddenError, KernelView
 
 
 @pytest.fixture(scope="module")
@@ -60,6 +75,259 @@ def create_kernel_request() -> CreateKernelRequest:
     )
 
 
+def test_build_kernel(create_kernel_request: CreateKernelRequest) -> None:
+    request = create_kernel_request.model_copy(
+        update={"env": {**create_kernel_request.env, "KERNEL_LANGUAGE": None}}
+    )
+    env = dict(request.env)
+
+    kernel = BaseKernelClient()._build_kernel(request)
+
+    # The request env is left untouched
+    assert request.env == env
+    assert kernel["metadata"] == {
+        "labels": {KERNEL_ID: env["KERNEL_ID"]},
+        "name": f"dev-{env['KERNEL_ID']}",
+        "namespace": "default",
+    }
+    spec = kernel["spec"]["template"]["spec"]
+    assert spec["volumes"] == env["KERNEL_VOLUMES"]
+    container = spec["containers"][0]
+    assert container["volumeMounts"] == env["KERNEL_VOLUME_MOUNTS"]
+    assert container["workingDir"] == "/mnt/data"
+    container_env = {item["name"]: item["value"] for item in container["env"]}
+    assert "KERNEL_VOLUMES" not in container_env
+    assert "KERNEL_VOLUME_MOUNTS" not in container_env
+    assert container_env["KERNEL_IDLE_TIMEOUT"] == "1800"
+    assert container_env["KERNEL_LANGUAGE"] == ""
+
+
+def test_kernel_view_cache() -> None:
+    kernel_client = BaseKernelClient()
+    kernel = {
+        "metadata": {
+            "name": "foo-0",
+            "namespace": "default",
+            "resourceVersion": "1",
+            "annotations": {KERNEL_ID: "968183bb-13ef-4faf-b7d8-30fe8d20e6a3"},
+        },
+        "status": {"connInfo": {"ip": "foo"}},
+    }
+    assert kernel_client._get_cached_kernel(kernel) is None
+
+    view = kernel_client._to_kernel_view(name="foo-0", kernel=kernel)
+    assert view.conn_info == {"ip": "foo"}
+    assert kernel_client._get_cached_kernel(kernel) is view
+
+    # A modified kernel is a miss
+    modified = {**kernel, "metadata": {**kernel["metadata"], "resourceVersion": "2"}}
+    assert kernel_client._get_cached_kernel(modified) is None
+
+
+def test_kernel_cache_eviction() -> None:
+    cache = _KernelCache(maxsize=2)
+    views = [KernelView(name=f"foo-{i}", kernel_id="", conn_info={}) for i in range(3)]
+    for view in views:
+        cache.put(("default", view.name), "1", view)
+
+    assert len(cache) == 2
+    assert cache.get(("default", "foo-0"), "1") is None
+    assert cache.get(("default", "foo-1"), "1") is views[1]
+    assert cache.get(("default", "foo-2"), "1") is views[2]
+
+    # Updating an entry doesn't evict another one
+    cache.put(("default", "foo-2"), "2", views[0])
+    assert len(cache) == 2
+    assert cache.get(("default", "foo-2"), "2") is views[0]
+
+    cache.pop(("default", "foo-1"))
+    cache.pop(("default", "foo-1"))
+    assert cache.get(("default", "foo-1"), "1") is None
+
+
+def ready_kernel(name: str, uid: str, ready: bool = True) -> dict:
+    return {
+        "metadata": {"name": name, "namespace": "default", "uid": uid},
+        "status": {"conditions": [{"type": "Ready", "status": str(ready)}]},
+    }
+
+
+@pytest.mark.parametrize(
+    "status,ready",
+    [
+        (None, False),
+        ({"conditions": []}, False),
+        ({"conditions": [{"type": "Scheduled", "status": "True"}]}, False),
+        ({"conditions": [{"type": "Ready", "status": "False"}]}, False),
+        ({"conditions": [{"type": "Ready", "status": "True"}]}, True),
+    ],
+)
+def test_is_kernel_ready(status: dict, ready: bool) -> None:
+    assert BaseKernelClient._is_kernel_ready({"status": status}) is ready
+
+
+def test_watch_init() -> None:
+    api_client = mock.Mock()
+    w = _Watch(api_client)
+
+    # Runs on the given api client with the base class' state
+    assert w._api_client is api_client
+    assert vars(w).keys() == vars(watch.Watch()).keys()
+
+
+def test_watch_unmarshal_event() -> None:
+    w = _Watch(mock.Mock())
+    obj = {"metadata": {"name": "foo-0", "resourceVersion": "42"}}
+
+    event = w.unmarshal_event(orjson.dumps({"type": "ADDED", "object": obj}), None)
+    assert event == {"type": "ADDED", "object": obj, "raw_object": obj}
+    assert w.resource_version == "42"
+
+    # Errors don't carry a kernel resource version
+    w.unmarshal_event(orjson.dumps({"type": "ERROR", "object": {"code": 410}}), None)
+    assert w.resource_version == "42"
+
+
+def test_kernel_informer_handle() -> None:
+    informer = _KernelInformer(mock.Mock(), "jupyter.org", "v1", "kernels", "default")
+
+    informer._handle({"type": "ADDED", "object": ready_kernel("foo-0", "1", False)})
+    assert informer.wait("foo-0", uid="1", timeout=0) is False
+
+    kernel = ready_kernel("foo-0", "1")
+    informer._handle({"type": "MODIFIED", "object": kernel})
+    assert informer.wait("foo-0", uid="1", timeout=0) is kernel
+    # A kernel of the same name created before is never returned
+    assert informer.wait("foo-0", uid="0", timeout=0) is False
+
+    informer._handle({"type": "BOOKMARK", "object": {"metadata": {}}})
+    assert informer.wait("foo-0", uid="1", timeout=0) is kernel
+
+    informer._handle({"type": "DELETED", "object": kernel})
+    assert informer.wait("foo-0", uid="1", timeout=0) is False
+    assert not informer._kernels
+    # Only recorded while someone waits on the name
+    assert not informer._deleted
+
+
+def test_kernel_informer_wait_deleted() -> None:
+    informer = _KernelInformer(mock.Mock(), "jupyter.org", "v1", "kernels", "default")
+    informer._waiters["foo-0"] = 1
+
+    informer._handle({"type": "DELETED", "object": ready_kernel("foo-0", "1")})
+    # Returns right away instead of waiting for the timeout
+    assert informer.wait("foo-0", uid="1", timeout=60) is False
+
+
+def test_kernel_informer_wait_wakeup() -> None:
+    informer = _KernelInformer(mock.Mock(), "jupyter.org", "v1", "kernels", "default")
+    kernel = ready_kernel("foo-0", "1")
+
+    def handle() -> None:
+        # Only the waiter of the kernel an event is about is woken up
+        with informer._lock:
+            notify = mock.Mock(wraps=informer._changed["foo-0"].notify_all)
+            informer._changed["foo-0"].notify_all = notify
+        informer._handle({"type": "ADDED", "object": ready_kernel("foo-1", "2")})
+        notify.assert_not_called()
+        informer._handle({"type": "ADDED", "object": kernel})
+        notify.assert_called_once()
+
+    timer = threading.Timer(0.1, handle)
+    timer.start()
+    assert informer.wait("foo-0", uid="1", timeout=60) is kernel
+    timer.join()
+    assert not informer._changed
+
+    timer = threading.Timer(0.1, informer.stop)
+    timer.start()
+    # Returns once stopped instead of waiting for the timeout
+    assert informer.wait("foo-1", uid="3", timeout=60) is False
+    timer.join()
+
+
+def test_create_many_duplicate_names(
+    create_kernel_request: CreateKernelRequest,
+) -> None:
+    with mock.patch("jkclient.client._get_api_client"):
+        kernel_client = JupyterKernelClient()
+    kernel_client._apply_kernel = mock.Mock()
+    request = create_kernel_request.model_copy(update={"name": "foo-0"})
+
+    with pytest.raises(ValueError, match="unique"):
+        kernel_client.create_many(requests=[request, request])
+    kernel_client._apply_kernel.assert_not_called()
+
+
+def test_async_client_closed_on_its_loop() -> None:
+    async_client = pytest.importorskip("jkclient.async_client")
+    with mock.patch("jkclient.client._get_api_client"):
+        kernel_client = JupyterKernelClient()
+    closed_on = []
+
+    async def close(self) -> None:
+        closed_on.append(asyncio.get_running_loop())
+
+    async def get_async_client():
+        await kernel_client._get_async_client()
+        return asyncio.get_running_loop()
+
+    with mock.patch.object(async_client.AsyncJupyterKernelClient, "close", close):
+        loop = asyncio.run(get_async_client())
+        # Closed while its loop shut down, not later from another loop
+        assert closed_on == [loop]
+        asyncio.run(get_async_client())
+    assert closed_on[0] is loop
+    assert len(closed_on) == 2
+
+
+def test_delete_by_kernel_id() -> None:
+    with mock.patch("jkclient.client._get_api_client"):
+        kernel_client = JupyterKernelClient()
+    kernel_client._list_kernels = mock.Mock(return_value=[ready_kernel("foo-0", "1")])
+    kernel_client.delete = mock.Mock()
+
+    kernel_client.delete_by_kernel_id(
+        kerenl_id="968183bb-13ef-4faf-b7d8-30fe8d20e6a3", timeout=5, limit=2
+    )
+    # List arguments only go to the lookup
+    kernel_client._list_kernels.assert_called_once_with(
+        f"{KERNEL_ID}=968183bb-13ef-4faf-b7d8-30fe8d20e6a3",
+        namespace=None,
+        timeout=5,
+        limit=2,
+    )
+    kernel_client.delete.assert_called_once_with(
+        name="foo-0", namespace="default", timeout=5
+    )
+
+
+@mock.patch("time.sleep")
+def test_call_with_retry(sleep: mock.Mock) -> None:
+    func = mock.Mock(
+        side_effect=[ApiException(status=429), ApiException(status=503), "ok"]
+    )
+
+    assert _call_with_retry(func, "foo-0", namespace="default") == "ok"
+    func.assert_called_with("foo-0", namespace="default")
+    assert func.call_count == 3
+    assert sleep.call_count == 2
+
+
+@mock.patch("time.sleep")
+def test_call_with_retry_error(sleep: mock.Mock) -> None:
+    func = mock.Mock(side_effect=ApiException(status=404))
+    with pytest.raises(ApiException):
+        _call_with_retry(func)
+    assert func.call_count == 1
+
+    func = mock.Mock(side_effect=ApiException(status=503))
+    with pytest.raises(ApiException):
+        _call_with_retry(func)
+    assert func.call_count == RETRY_ATTEMPTS
+    assert sleep.call_count == RETRY_ATTEMPTS - 1
+
+
 @pytest.mark.skip(reason="Create kernel with kubernetes config")
 def test_create_kernel(
     kernel_client: JupyterKernelClient, create_kernel_request: CreateKernelRequest
@@ -69,12 +337,35 @@ def test_create_kernel(
     assert response is not None
 
 
+@pytest.mark.skip(reason="Create kernel with kubernetes config")
+def test_create_many_kernels(
+    kernel_client: JupyterKernelClient, create_kernel_request: CreateKernelRequest
+) -> None:
+    requests = [
+        create_kernel_request.model_copy(
+            update={
+                "name": f"foo-{i}",
+                "env": {**create_kernel_request.env, "KERNEL_ID": str(uuid4())},
+            }
+        )
+        for i in range(1, 4)
+    ]
+    response = kernel_client.create_many(requests=requests)
+    assert [kernel.name for kernel in response] == ["foo-1", "foo-2", "foo-3"]
+
+
 @pytest.mark.skip(reason="Get kernel with kubernetes config")
 def test_get_kernel(kernel_client: JupyterKernelClient) -> None:
     kernel = kernel_client.get(name="foo-0", namespace="default")
     assert kernel is not None
 
 
+@pytest.mark.skip(reason="Get kernel with kubernetes config")
+def test_get_fast_kernel(kernel_client: JupyterKernelClient) -> None:
+    kernel = kernel_client.get_fast(name="foo-0", namespace="default")
+    assert kernel.name == "foo-0"
+
+
 @pytest.mark.skip(reason="Get kernel with kubernetes config")
 def test_get_kernel_none(kernel_client: JupyterKernelClient) -> None:
     with pytest.raises(RuntimeError):
@@ -91,11 +382,26 @@ def test_delete_kernel_by_kernel_id(kernel_client: JupyterKernelClient) -> None:
     kernel_client.delete_by_kernel_id(kerenl_id="968183bb-13ef-4faf-b7d8-30fe8d20e6a3")
 
 
+@pytest.mark.skip(reason="Delete kernel with kubernetes config")
+def test_delete_kernel_by_kernel_ids(kernel_client: JupyterKernelClient) -> None:
+    kernel_client.delete_by_kernel_ids(
+        kernel_ids=["968183bb-13ef-4faf-b7d8-30fe8d20e6a3", str(uuid4())]
+    )
+
+
 @pytest.mark.skip(reason="Delete kernel with kubernetes config")
 def test_delete_kernel_none(kernel_client: JupyterKernelClient) -> None:
     kernel_client.delete_by_kernel_id(kerenl_id=str(uuid4()))
 
 
+@pytest.mark.skip(reason="Delete kernel with kubernetes config")
+def test_delete_kernel_by_labels(kernel_client: JupyterKernelClient) -> None:
+    kernel_client.delete_by_labels(
+        label_selector="jupyter.org/kernel-id=968183bb-13ef-4faf-b7d8-30fe8d20e6a3",
+        namespace="default",
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.skip(reason="Create kernel with kubernetes config")
 async def test_acreate_kernel(
@@ -136,5 +442,14 @@ async def test_adelete_kernel_w_kid(kernel_client: JupyterKernelClient) -> None:
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.skip(reason="Delete kernel with kubernetes config")
+async def test_adelete_kernel_by_labels(kernel_client: JupyterKernelClient) -> None:
+    await kernel_client.adelete_by_labels(
+        label_selector="jupyter.org/kernel-id=968183bb-13ef-4faf-b7d8-30fe8d20e6a3",
+        namespace="default",
+    )
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,61 +1,132 @@
+import datetime
+
 import pytest
+from kubernetes.client import V1ObjectMeta, V1PodTemplateSpec
 
 from jkclient import V1Kernel
+from jkclient.models import V1KernelSpec
 
-
-def test_kernel_model() -> None:
-    kernel = {
-        "api_version": "jupyter.org/v1beta1",
-        "kind": "Kernel",
-        "metadata": {
-            "annotations": {"sidecar.istio.io/inject": "false"},
-            "labels": {"app": "kernel"},
-            "name": "kernel-7d25af7c-e687-46f6-98c3-0e7a0ce3a001",
-            "namespace": "kubeflow-zc",
-        },
-        "spec": {
-            "template": {
-                "spec": {
-                    "containers": [
-                        {
-                            "env": [
-                                {
-                                    "name": "KERNEL_ID",
-                                    "value": "7d25af7c-e687-46f6-98c3-0e7a0ce3a001",
-                                },
-                                {"name": "KERNEL_USERNAME", "value": "jovyan"},
-                                {"name": "KERNEL_LANGUAGE", "value": "python"},
-                                {"name": "JPY_PARENT_PID", "value": "7"},
-                                {"name": "LC_CTYPE", "value": "C.UTF-8"},
-                                {"name": "KERNEL_IDLE_TIMEOUT", "value": "60"},
-                            ],
-                            "image": "weekenthralling/kernel-py:133fbe3",
-                            "name": "kernel",
-                            "volumeMounts": [
-                                {"mountPath": "/mnt/shared", "name": "shared-vol"},
-                            ],
-                        }
-                    ],
-                    "restart_policy": "Never",
-                    "volumes": [
-                        {
-                            "name": "shared-vol",
-                            "nfs": {
-                                "path": "/data/tablegpt-test/shared/",
-                                "server": "10.0.0.29",
+KERNEL = {
+    "api_version": "jupyter.org/v1beta1",
+    "kind": "Kernel",
+    "metadata": {
+        "annotations": {"sidecar.istio.io/inject": "false"},
+        "labels": {"app": "kernel"},
+        "name": "kernel-7d25af7c-e687-46f6-98c3-0e7a0ce3a001",
+        "namespace": "kubeflow-zc",
+    },
+    "spec": {
+        "template": {
+            "spec": {
+                "containers": [
+                    {
+                        "env": [
+                            {
+                                "name": "KERNEL_ID",
+                                "value": "7d25af7c-e687-46f6-98c3-0e7a0ce3a001",
                             },
-                        }
-                    ],
-                }
+                            {"name": "KERNEL_USERNAME", "value": "jovyan"},
+                            {"name": "KERNEL_LANGUAGE", "value": "python"},
+                            {"name": "JPY_PARENT_PID", "value": "7"},
+                            {"name": "LC_CTYPE", "value": "C.UTF-8"},
+                            {"name": "KERNEL_IDLE_TIMEOUT", "value": "60"},
+                        ],
+                        "image": "weekenthralling/kernel-py:133fbe3",
+                        "name": "kernel",
+                        "volumeMounts": [
+                            {"mountPath": "/mnt/shared", "name": "shared-vol"},
+                        ],
+                    }
+                ],
+                "restart_policy": "Never",
+                "volumes": [
+                    {
+                        "name": "shared-vol",
+                        "nfs": {
+                            "path": "/data/tablegpt-test/shared/",
+                            "server": "10.0.0.29",
+                        },
+                    }
+                ],
             }
-        },
-    }
+        }
+    },
+}
+
 
-    v1_kernel = V1Kernel(**kernel)
+def test_kernel_model() -> None:
+    v1_kernel = V1Kernel(**KERNEL)
     assert v1_kernel.api_version == "jupyter.org/v1beta1"
     assert v1_kernel.kind == "Kernel"
     assert v1_kernel.status is None
 
 
+def test_kernel_spec_to_str() -> None:
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    v1_kernel_spec = V1KernelSpec(
+        template={"spec": {"restartPolicy": "Never"}, "metadata": {"created": created}}
+    )
+
+    # Indented, key sorted JSON
+    assert v1_kernel_spec.to_str() == (
+        "{\n"
+        '  "template": {\n'
+        '    "metadata": {\n'
+        '      "created": "2024-01-01T00:00:00+00:00"\n'
+        "    },\n"
+        '    "spec": {\n'
+        '      "restartPolicy": "Never"\n'
+        "    }\n"
+        "  }\n"
+        "}"
+    )
+    assert repr(v1_kernel_spec) == v1_kernel_spec.to_str()
+
+
+def test_kernel_spec_eq() -> None:
+    v1_kernel_spec = V1KernelSpec(template=KERNEL["spec"]["template"])
+
+    assert v1_kernel_spec == V1KernelSpec(template=KERNEL["spec"]["template"])
+    assert not v1_kernel_spec != V1KernelSpec(template=KERNEL["spec"]["template"])
+    assert v1_kernel_spec != V1KernelSpec(template={"spec": {}})
+    assert not v1_kernel_spec == V1KernelSpec(template={"spec": {}})
+
+
+def test_kernel_spec_eq_dict_template() -> None:
+    template = V1PodTemplateSpec(metadata=V1ObjectMeta(name="foo-0"))
+    v1_kernel_spec = V1KernelSpec(template=template)
+
+    # A model template equals the same template given as a dict
+    assert v1_kernel_spec == V1KernelSpec(template=template.to_dict())
+    assert V1KernelSpec(template=template.to_dict()) == v1_kernel_spec
+    assert v1_kernel_spec != V1KernelSpec(template={"metadata": {"name": "foo-1"}})
+
+
+@pytest.mark.parametrize("other", [None, {}, KERNEL["spec"], V1Kernel(**KERNEL)])
+def test_kernel_spec_eq_other_type(other) -> None:
+    v1_kernel_spec = V1KernelSpec(template=KERNEL["spec"]["template"])
+
+    assert not v1_kernel_spec == other
+    assert v1_kernel_spec != other
+
+
+def test_kernel_spec_slots() -> None:
+    template = V1PodTemplateSpec(metadata=V1ObjectMeta(name="foo-0"))
+    v1_kernel_spec = V1KernelSpec(template=template)
+
+    assert not hasattr(v1_kernel_spec, "__dict__")
+    with pytest.raises(AttributeError):
+        v1_kernel_spec.foo = "bar"
+
+    # Nested models are converted, plain dicts are kept as is
+    assert v1_kernel_spec.to_dict() == {"template": template.to_dict()}
+    assert V1KernelSpec(**v1_kernel_spec.to_dict()).to_dict() == {
+        "template": template.to_dict()
+    }
+    assert V1KernelSpec(template=KERNEL["spec"]["template"]).to_dict() == {
+        "template": KERNEL["spec"]["template"]
+    }
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,83 +1,115 @@
+import json
 from uuid import uuid4
 
 import pytest
 
-from jkclient import CreateKernelRequest
+from jkclient import CreateKernelRequest, Kernel, KernelView
 
+KERNEL_ENV = {
+    "KERNEL_USERNAME": "jovyan",
+    "KERNEL_NAMESPACE": "default",
+    "KERNEL_IMAGE": "weekenthralling/kernel-py:0.0.1",
+    "KERNEL_WORKING_DIR": "/mnt/data",
+    "KERNEL_STARTUP_SCRIPTS_PATH": "/opt/startup",
+}
+KERNEL_VOLUME_MOUNTS = [
+    {"name": "shared-vol", "mount_path": "/mnt/data"},
+    {"name": "ipython-profile-vol", "mount_path": "/opt/startup"},
+]
+KERNEL_VOLUMES = [
+    {"name": "shared-vol", "nfs": {"server": "10.0.0.29", "path": "/data"}},
+    {"name": "ipython-profile-vol", "config_map": {"name": "ipython-startup-scripts"}},
+]
+# Same volumes with the Kubernetes API (camel case) keys
+KERNEL_VOLUME_MOUNTS_CAMEL_CASE = [
+    {"name": "shared-vol", "mountPath": "/mnt/data"},
+    {"name": "ipython-profile-vol", "mountPath": "/opt/startup", "readOnly": True},
+]
+KERNEL_VOLUMES_CAMEL_CASE = [
+    {"name": "shared-vol", "nfs": {"server": "10.0.0.29", "path": "/data"}},
+    {"name": "ipython-profile-vol", "configMap": {"name": "ipython-startup-scripts"}},
+]
 
-def test_create_kernel_request() -> None:
-    name = f"kernel-{uuid4().hex}"
-    request = CreateKernelRequest(name=name)
 
-    assert request.name == name
-    assert request.env == {}
+def test_create_kernel_request(kernel_name: str) -> None:
+    request = CreateKernelRequest(name=kernel_name)
 
+    assert request.name == kernel_name
+    assert request.env == {}
 
-def test_create_kernel_request_env() -> None:
-    name = f"kernel-{uuid4().hex}"
 
+@pytest.mark.parametrize(
+    "encode,volume_mounts,volumes",
+    [
+        (lambda value: value, KERNEL_VOLUME_MOUNTS, KERNEL_VOLUMES),
+        (json.dumps, KERNEL_VOLUME_MOUNTS, KERNEL_VOLUMES),
+        (json.dumps, KERNEL_VOLUME_MOUNTS_CAMEL_CASE, KERNEL_VOLUMES_CAMEL_CASE),
+    ],
+    ids=["list", "json_str", "camel_case"],
+)
+def test_create_kernel_request_env(
+    kernel_name: str, encode, volume_mounts: list, volumes: list
+) -> None:
     env = {
-        "KERNEL_USERNAME": "jovyan",
-        "KERNEL_NAMESPACE": "default",
-        "KERNEL_IMAGE": "weekenthralling/kernel-py:0.0.1",
-        "KERNEL_WORKING_DIR": "/mnt/data",
-        "KERNEL_VOLUME_MOUNTS": [
-            {"name": "shared-vol", "mount_path": "/mnt/data"},
-            {"name": "ipython-profile-vol", "mount_path": "/opt/startup"},
-        ],
-        "KERNEL_VOLUMES": [
-            {
-                "name": "shared-vol",
-                "nfs": {"server": "10.0.0.29", "path": "/data"},
-            },
-            {
-                "name": "ipython-profile-vol",
-                "config_map": {"name": "ipython-startup-scripts"},
-            },
-        ],
-        "KERNEL_STARTUP_SCRIPTS_PATH": "/opt/startup",
+        **KERNEL_ENV,
+        "KERNEL_VOLUME_MOUNTS": encode(volume_mounts),
+        "KERNEL_VOLUMES": encode(volumes),
     }
-    request = CreateKernelRequest(name=name, env=env)
-    assert request.env is not None
+    request = CreateKernelRequest(name=kernel_name, env=env)
     assert request.env["KERNEL_NAMESPACE"] == "default"
+    # Keys are passed through as is
+    assert request.env["KERNEL_VOLUME_MOUNTS"] == volume_mounts
+    assert request.env["KERNEL_VOLUMES"] == volumes
 
 
-def test_create_kernel_request_env_error() -> None:
-    name = f"kernel-{uuid4().hex}"
-    env = {
-        "KERNEL_USERNAME": "jovyan",
-        "KERNEL_NAMESPACE": "default",
-        "KERNEL_IMAGE": "weekenthralling/kernel-py:0.0.1",
-        "KERNEL_WORKING_DIR": "/mnt/data",
-        "KERNEL_VOLUME_MOUNTS": "foo-0",
-        "KERNEL_VOLUMES": "bar-0",
-        "KERNEL_STARTUP_SCRIPTS_PATH": "/opt/startup",
-    }
+@pytest.mark.parametrize(
+    "env",
+    [
+        {},
+        {"KERNEL_VOLUMES": KERNEL_VOLUMES},
+        {"KERNEL_VOLUMES": json.dumps(KERNEL_VOLUMES)},
+    ],
+    ids=["empty", "list", "json_str"],
+)
+def test_convert_env_value_to_list(env: dict) -> None:
+    volumes = env.get("KERNEL_VOLUMES")
+
+    converted = CreateKernelRequest.convert_env_value_to_list(env)
+    # Converted in place, neither the env nor an already decoded list is copied
+    assert converted is env
+    if volumes is None:
+        assert converted == {}
+    else:
+        assert converted["KERNEL_VOLUMES"] == KERNEL_VOLUMES
+    if isinstance(volumes, list):
+        assert converted["KERNEL_VOLUMES"] is volumes
+
+
+def test_create_kernel_request_env_error(kernel_name: str) -> None:
+    env = {**KERNEL_ENV, "KERNEL_VOLUME_MOUNTS": "foo-0", "KERNEL_VOLUMES": "bar-0"}
     with pytest.raises(ValueError) as excinfo:
-        CreateKernelRequest(name=name, env=env)
+        CreateKernelRequest(name=kernel_name, env=env)
         assert str(excinfo.value) == "`KERNEL_VOLUME_MOUNTS` must be a json str"
 
 
-def test_create_kernel_request_env_volumns() -> None:
-    import json
+def test_create_kernel_request_from_trusted(kernel_name: str) -> None:
+    request = CreateKernelRequest(
+        name=kernel_name,
+        env={"KERNEL_VOLUMES": '[{"name":"shared-vol","emptyDir":{}}]'},
+    )
 
-    name = f"kernel-{uuid4().hex}"
-    env = {
-        "KERNEL_USERNAME": "jovyan",
-        "KERNEL_NAMESPACE": "default",
-        "KERNEL_IMAGE": "weekenthralling/kernel-py:0.0.1",
-        "KERNEL_WORKING_DIR": "/mnt/data",
-        "KERNEL_VOLUME_MOUNTS": '[{"name":"shared-vol","mount_path":"/mnt/data"},{"name":"ipython-profile-vol","mount_path":"/opt/startup"}]',
-        "KERNEL_VOLUMES": '[{"name":"shared-vol","nfs":{"server":"10.0.0.29","path":"/data/tablegpt-slim-py/data"}},{"name":"ipython-profile-vol","config_map":{"name":"ipython-startup-scripts"}}]',
-        "KERNEL_STARTUP_SCRIPTS_PATH": "/opt/startup",
-    }
-    request = CreateKernelRequest(name=name, env=env)
-    assert isinstance(request.env["KERNEL_VOLUME_MOUNTS"], list)
-    assert request.env["KERNEL_VOLUME_MOUNTS"] == json.loads(
-        env["KERNEL_VOLUME_MOUNTS"]
+    trusted = CreateKernelRequest.from_trusted(request.model_dump())
+    assert trusted == request
+    assert trusted.env["KERNEL_VOLUMES"] == [{"name": "shared-vol", "emptyDir": {}}]
+
+
+def test_kernel_view() -> None:
+    view = KernelView(name="foo-0", kernel_id=str(uuid4()), conn_info={"ip": "foo"})
+
+    assert view.conn_info["ip"] == "foo"
+    assert Kernel(**view._asdict()) == Kernel(
+        name=view.name, kernel_id=view.kernel_id, conn_info=view.conn_info
     )
-    assert isinstance(request.env["KERNEL_VOLUMES"], list)
-    assert request.env["KERNEL_VOLUMES"] == json.loads(env["KERNEL_VOLUMES"])
 
 
 if __name__ == "__main__":